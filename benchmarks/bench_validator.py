@@ -0,0 +1,199 @@
+'''
+Benchmarks of the hot paths of :mod:`validictory.validator`, written for pyperf::
+
+    pip install .[benchmark]
+    python benchmarks/bench_validator.py -o results.json
+    python -m pyperf compare_to before.json results.json
+
+Each workload is run uncompiled (a new validator per call, like the module level
+function used to do), through :func:`validictory.validate` and its cache of
+compiled schemas, through a compiled schema and through a schema compiled with
+``codegen=True``.  The names of workloads (for example ``wide_object``) can
+be given as arguments to only run those.
+'''
+import pyperf
+
+import validictory
+
+
+def wide_object():
+    ''' An object with many properties of mixed types '''
+    properties = {}
+    document = {}
+    for index in range(200):
+        kind = index % 4
+        if kind == 0:
+            properties[f'name{index}'] = {'type': 'string', 'maxLength': 50}
+            document[f'name{index}'] = f'value {index}'
+        elif kind == 1:
+            properties[f'count{index}'] = {'type': 'integer', 'minimum': 0}
+            document[f'count{index}'] = index
+        elif kind == 2:
+            properties[f'ratio{index}'] = {'type': 'number', 'maximum': 1000}
+            document[f'ratio{index}'] = index / 3
+        else:
+            properties[f'flag{index}'] = {'type': 'boolean', 'required': False}
+            document[f'flag{index}'] = bool(index % 8)
+    return {'type': 'object', 'properties': properties}, document, {}
+
+
+def deep_nesting():
+    ''' Objects nested 50 levels deep '''
+    schema = {'type': 'object', 'properties': {'leaf': {'type': 'string'}}}
+    document = {'leaf': 'bottom'}
+    for depth in range(50):
+        schema = {'type': 'object', 'properties': {'id': {'type': 'integer'},
+                                                   'child': schema}}
+        document = {'id': depth, 'child': document}
+    return schema, document, {}
+
+
+def long_array():
+    ''' An array of many small objects, going through ``validate_items`` '''
+    schema = {
+        'type': 'array',
+        'items': {
+            'type': 'object',
+            'properties': {
+                'id': {'type': 'integer'},
+                'label': {'type': 'string', 'pattern': '^[a-z]+ [0-9]+$'},
+                'score': {'type': 'number', 'minimum': 0, 'maximum': 100},
+            },
+        },
+    }
+    document = [{'id': index, 'label': f'item {index}', 'score': index % 100}
+                for index in range(10000)]
+    return schema, document, {}
+
+
+def numeric_items():
+    ''' A long list of numbers against a simple ``items`` schema '''
+    schema = {'type': 'array', 'items': {'type': 'number', 'minimum': 0, 'maximum': 1}}
+    document = [index / 100000 for index in range(100000)]
+    return schema, document, {}
+
+
+def pattern_properties():
+    ''' A map whose keys are matched by ``patternProperties`` '''
+    schema = {
+        'type': 'object',
+        'patternProperties': {
+            '^str_': {'type': 'string'},
+            '^int_': {'type': 'integer'},
+            '^num_[0-9]+$': {'type': 'number'},
+        },
+        'additionalProperties': False,
+    }
+    document = {}
+    for index in range(1000):
+        document[f'str_{index}'] = str(index)
+        document[f'int_{index}'] = index
+        document[f'num_{index}'] = index / 7
+    return schema, document, {}
+
+
+def unique_items():
+    ''' ``uniqueItems`` on a large list of scalars and objects '''
+    schema = {'type': 'array', 'uniqueItems': True}
+    document = list(range(2000)) + [f'string {index}' for index in range(2000)]
+    document += [{'id': index} for index in range(500)]
+    return schema, document, {}
+
+
+def formats():
+    ''' Records in which most fields have a ``format`` '''
+    schema = {
+        'type': 'array',
+        'items': {
+            'type': 'object',
+            'properties': {
+                'created': {'type': 'string', 'format': 'date-time'},
+                'day': {'type': 'string', 'format': 'date'},
+                'at': {'type': 'string', 'format': 'time'},
+                'ip': {'type': 'string', 'format': 'ip-address'},
+                'host': {'type': 'string', 'format': 'hostname'},
+                'homepage': {'type': 'string', 'format': 'uri'},
+            },
+        },
+    }
+    document = [{
+        'created': f'2020-01-{index % 28 + 1:02}T10:{index % 60:02}:00Z',
+        'day': f'2020-02-{index % 28 + 1:02}',
+        'at': f'10:{index % 60:02}:30',
+        'ip': f'10.0.{index % 256}.{index % 100}',
+        'host': f'host{index % 50}.example.com',
+        'homepage': f'https://example.com/users/{index}',
+    } for index in range(2000)]
+    return schema, document, {}
+
+
+def errors():
+    ''' Mostly invalid records validated with ``fail_fast=False`` '''
+    schema = {
+        'type': 'array',
+        'items': {
+            'type': 'object',
+            'properties': {
+                'name': {'type': 'string', 'minLength': 3},
+                'age': {'type': 'integer', 'minimum': 0},
+                'email': {'type': 'string', 'pattern': '^[^@]+@[^@]+$'},
+            },
+        },
+    }
+    document = [{'name': 'x' if index % 2 else index, 'age': -index,
+                 'email': 'nobody'} for index in range(2000)]
+    return schema, document, {'fail_fast': False}
+
+
+WORKLOADS = [wide_object, deep_nesting, long_array, numeric_items, pattern_properties,
+             unique_items, formats, errors]
+
+
+def bench_uncompiled(schema, document, options):
+    try:
+        validictory.SchemaValidator(**options).validate(document, schema)
+    except validictory.ValidationError:
+        pass
+
+
+def bench_validate(schema, document, options):
+    try:
+        validictory.validate(document, schema, **options)
+    except validictory.ValidationError:
+        pass
+
+
+def bench_compiled(compiled, document):
+    try:
+        compiled.validate(document)
+    except validictory.ValidationError:
+        pass
+
+
+def add_cmdline_args(cmd, args):
+    cmd.extend(args.workloads)
+
+
+def main():
+    runner = pyperf.Runner(add_cmdline_args=add_cmdline_args)
+    runner.metadata['description'] = 'validictory validation benchmarks'
+    runner.argparser.add_argument('workloads', nargs='*',
+                                  help='names of the workloads to run (default: all)')
+    args = runner.parse_args()
+
+    for workload in WORKLOADS:
+        if args.workloads and workload.__name__ not in args.workloads:
+            continue
+        schema, document, options = workload()
+        runner.bench_func(f'{workload.__name__}-uncompiled', bench_uncompiled, schema,
+                          document, options)
+        runner.bench_func(f'{workload.__name__}-validate', bench_validate, schema, document,
+                          options)
+        compiled = validictory.compile(schema, **options)
+        runner.bench_func(f'{workload.__name__}-compiled', bench_compiled, compiled, document)
+        compiled = validictory.compile(schema, codegen=True, **options)
+        runner.bench_func(f'{workload.__name__}-codegen', bench_compiled, compiled, document)
+
+
+if __name__ == '__main__':
+    main()
@@ -34,5 +34,12 @@ setup(name='validictory',
           'test': [
               'pytest',
               'pytest-cov',
-          ]
+              'numpy',
+          ],
+          'numpy': [
+              'numpy',
+          ],
+          'benchmark': [
+              'pyperf',
+          ],
       })
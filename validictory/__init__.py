@@ -1,18 +1,101 @@
 #!/usr/bin/env python
 
-from validictory.validator import (FieldValidationError, MultipleValidationError, SchemaError,
-                                   SchemaValidator, ValidationError)
+import copy
+import threading
+from collections import OrderedDict, namedtuple
 
-__all__ = ['validate', 'SchemaValidator', 'FieldValidationError', 'MultipleValidationError',
-           'ValidationError', 'SchemaError']
+from validictory.validator import (CompiledSchema, FieldValidationError, MultipleValidationError,
+                                   SchemaError, SchemaValidator, ValidationError, ValidationStats,
+                                   _fingerprint)
+
+__all__ = ['validate', 'validate_many', 'validate_columns', 'validate_async',
+           'validate_many_async', 'compile', 'cache_info', 'cache_clear', 'SchemaValidator',
+           'CompiledSchema', 'ValidationStats',
+           'FieldValidationError', 'MultipleValidationError', 'ValidationError', 'SchemaError']
 __version__ = '1.1.3'
 
+CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+# schemas compiled by validate(), keyed by the fingerprint of the schema and the options
+_SCHEMA_CACHE_SIZE = 128
+_schema_cache = OrderedDict()
+_schema_cache_lock = threading.Lock()
+_schema_cache_hits = _schema_cache_misses = 0
+
+
+# options added after the original ones are only passed to validator classes when they
+# aren't the default, so that subclasses whose __init__ doesn't take them keep working
+_EXTRA_OPTION_DEFAULTS = {'regex_cache_size': 128, 'format_cache_size': 0, 'max_errors': None}
+
+
+def _new_validator(validator_cls, format_validators=None, required_by_default=True,
+                   blank_by_default=False, disallow_unknown_properties=False,
+                   apply_default_to_data=False, fail_fast=True,
+                   remove_unknown_properties=False, **extra_options):
+    extra_options = {name: value for name, value in extra_options.items()
+                     if value != _EXTRA_OPTION_DEFAULTS[name]}
+    return validator_cls(format_validators, required_by_default, blank_by_default,
+                         disallow_unknown_properties, apply_default_to_data, fail_fast,
+                         remove_unknown_properties, **extra_options)
+
+
+def cache_info():
+    '''
+    Returns the statistics of the cache of schemas compiled by :func:`validate`, as a
+    named tuple of ``hits``, ``misses``, ``maxsize`` and ``currsize``.
+    '''
+    with _schema_cache_lock:
+        return CacheInfo(_schema_cache_hits, _schema_cache_misses, _SCHEMA_CACHE_SIZE,
+                         len(_schema_cache))
+
+
+def cache_clear():
+    ''' Empties the cache of schemas compiled by :func:`validate` and resets its statistics '''
+    global _schema_cache_hits, _schema_cache_misses
+    with _schema_cache_lock:
+        _schema_cache.clear()
+        _schema_cache_hits = _schema_cache_misses = 0
+
+
+def _cached_compile(schema, validator_cls, format_validators, **options):
+    '''
+    Returns the :class:`CompiledSchema` of a schema, reusing the one compiled by an earlier
+    call for a schema of the same structure with the same options.
+    '''
+    global _schema_cache_hits, _schema_cache_misses
+    try:
+        # format validators are compared by identity
+        key = (_fingerprint(schema), validator_cls,
+               tuple(format_validators.items()) if format_validators else None,
+               tuple(options.items()))
+        hash(key)
+    except TypeError:
+        return _new_validator(validator_cls, format_validators, **options).compile(schema)
+
+    with _schema_cache_lock:
+        compiled = _schema_cache.get(key)
+        if compiled is not None:
+            _schema_cache.move_to_end(key)
+            _schema_cache_hits += 1
+            return compiled
+
+    # the caller may change its schema afterwards, while compiled plans rely on it not changing
+    compiled = _new_validator(validator_cls, format_validators,
+                              **options).compile(copy.deepcopy(schema))
+    with _schema_cache_lock:
+        _schema_cache_misses += 1
+        _schema_cache[key] = compiled
+        if len(_schema_cache) > _SCHEMA_CACHE_SIZE:
+            _schema_cache.popitem(last=False)
+    return compiled
+
 
 def validate(data, schema, validator_cls=SchemaValidator,
              format_validators=None, required_by_default=True,
              blank_by_default=False, disallow_unknown_properties=False,
              apply_default_to_data=False, fail_fast=True,
-             remove_unknown_properties=False):
+             remove_unknown_properties=False, regex_cache_size=128,
+             format_cache_size=0, max_errors=None):
     '''
     Validates a parsed json document against the provided schema. If an
     error is found a :class:`ValidationError` is raised.
@@ -36,11 +119,140 @@ def validate(data, schema, validator_cls=SchemaValidator,
     :param remove_unknown_properties: defaults to False, set to True to
         filter out properties not listed in the schema definition. Only applies
         when disallow_unknown_properties is False.
+    :param regex_cache_size: defaults to 128, the number of compiled regular
+        expressions kept by the validator, set to None for an unbounded cache.
+    :param format_cache_size: defaults to 0, set to a positive number to
+        remember that many values which passed their format validator.
+    :param max_errors: optional number of errors after which validation
+        stops when ``fail_fast`` is False.
+
+    The validator and the compiled schema are kept in a bounded cache (see
+    :func:`cache_info`), and reused by later calls with a schema of the same
+    structure and the same options.
+    '''
+    compiled = _cached_compile(schema, validator_cls, format_validators,
+                               required_by_default=required_by_default,
+                               blank_by_default=blank_by_default,
+                               disallow_unknown_properties=disallow_unknown_properties,
+                               apply_default_to_data=apply_default_to_data,
+                               fail_fast=fail_fast,
+                               remove_unknown_properties=remove_unknown_properties,
+                               regex_cache_size=regex_cache_size,
+                               format_cache_size=format_cache_size,
+                               max_errors=max_errors)
+    return compiled.validate(data)
+
+
+def validate_many(documents, schema, validator_cls=SchemaValidator,
+                  format_validators=None, required_by_default=True,
+                  blank_by_default=False, disallow_unknown_properties=False,
+                  apply_default_to_data=False, fail_fast=True,
+                  remove_unknown_properties=False, regex_cache_size=128,
+                  format_cache_size=0, workers=None, chunksize=256, max_errors=None):
+    '''
+    Validates each parsed json document of an iterable against the provided
+    schema, setting up the validator and compiling the schema only once.
+
+    Returns a list with an entry per document: the list of its validation
+    errors, which is empty if the document is valid.  Invalid documents don't
+    stop the batch, but a :class:`SchemaError` is still raised.
+
+    :param documents: iterable of python data to validate
+    :param workers: optional number of processes to spread the documents over,
+        see :meth:`SchemaValidator.validate_many`
+    :param chunksize: number of documents sent to a process at a time when
+        ``workers`` is used
+
+    All other parameters are the same as for :func:`validate`.
+    '''
+    v = _new_validator(validator_cls, format_validators, required_by_default, blank_by_default,
+                       disallow_unknown_properties, apply_default_to_data, fail_fast,
+                       remove_unknown_properties, regex_cache_size=regex_cache_size,
+                       format_cache_size=format_cache_size, max_errors=max_errors)
+    return v.compile(schema).validate_many(documents, workers, chunksize)
+
+
+def validate_columns(columns, schema, validator_cls=SchemaValidator,
+                     format_validators=None, required_by_default=True,
+                     blank_by_default=False, disallow_unknown_properties=False,
+                     apply_default_to_data=False, fail_fast=True,
+                     remove_unknown_properties=False, regex_cache_size=128,
+                     format_cache_size=0, max_errors=None):
+    '''
+    Validates a batch of records stored by columns against the provided
+    schema of each record, a flat object, checking each column at once where
+    the schema allows it.
+
+    Returns a list with an entry per row: the list of the validation errors
+    of the record in that row, which is empty if it is valid.
+
+    :param columns: mapping of the name of each field to the sequence of its
+        values, or a pandas DataFrame or pyarrow Table, see
+        :meth:`SchemaValidator.validate_columns`
+
+    All other parameters are the same as for :func:`validate`.
+    '''
+    v = _new_validator(validator_cls, format_validators, required_by_default, blank_by_default,
+                       disallow_unknown_properties, apply_default_to_data, fail_fast,
+                       remove_unknown_properties, regex_cache_size=regex_cache_size,
+                       format_cache_size=format_cache_size, max_errors=max_errors)
+    return v.compile(schema).validate_columns(columns)
+
+
+async def validate_async(data, schema, validator_cls=SchemaValidator, executor=None,
+                         **options):
+    '''
+    Coroutine version of :func:`validate`, taking the same keyword parameters.
+
+    The validation runs in a thread of ``executor`` (the default executor of
+    the running event loop if None), so that validating a large document
+    doesn't block the event loop.
+    '''
+    await validator_cls(**options).validate_async(data, schema, executor)
+
+
+def validate_many_async(documents, schema, validator_cls=SchemaValidator, chunksize=256,
+                        executor=None, **options):
+    '''
+    Asynchronous generator version of :func:`validate_many`, taking the same
+    keyword parameters.
+
+    Yields the list of errors of each document of the asynchronous iterable
+    ``documents``, in order.  Documents are validated by chunks of
+    ``chunksize`` in a thread of ``executor`` (the default executor of the
+    running event loop if None).
+    '''
+    return validator_cls(**options).compile(schema).validate_many_async(documents, chunksize,
+                                                                        executor)
+
+
+def compile(schema, validator_cls=SchemaValidator,
+            format_validators=None, required_by_default=True,
+            blank_by_default=False, disallow_unknown_properties=False,
+            apply_default_to_data=False, fail_fast=True,
+            remove_unknown_properties=False, regex_cache_size=128,
+            format_cache_size=0, codegen=False, max_errors=None):
+    '''
+    Prepares a schema for repeated validation and returns a
+    :class:`CompiledSchema` whose ``validate(data)`` method behaves like
+    :func:`validate` with the same options.
+
+    Use this when validating many documents against the same schema, the work
+    of interpreting the schema is then done only once.
+
+    :param schema: python dictionary representing the schema (see
+        :ref:`schema-format`)
+
+    :param codegen: defaults to False, set to True to generate a specialized
+        Python function for each sub-schema
+
+    All other parameters are the same as for :func:`validate`.
     '''
-    v = validator_cls(format_validators, required_by_default, blank_by_default,
-                      disallow_unknown_properties, apply_default_to_data, fail_fast,
-                      remove_unknown_properties)
-    return v.validate(data, schema)
+    v = _new_validator(validator_cls, format_validators, required_by_default, blank_by_default,
+                       disallow_unknown_properties, apply_default_to_data, fail_fast,
+                       remove_unknown_properties, regex_cache_size=regex_cache_size,
+                       format_cache_size=format_cache_size, max_errors=max_errors)
+    return v.compile(schema, codegen=codegen)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,145 @@
+'''
+Code generation backend used by :meth:`SchemaValidator.compile` when called
+with ``codegen=True``.
+
+The plan of every sub-schema is turned into a plain Python function.  Cheap
+checks for common keywords (types, lengths, ranges, patterns, ``required`` and
+``blank``) are inlined, and the ``validate_*`` method of a keyword is only
+called when its check fails so that it can report the error.  Keywords that
+can't be inlined, or whose method was overridden by a subclass, are always
+delegated to their method.
+'''
+import functools
+import re
+from decimal import Decimal
+
+from validictory.validator import SchemaValidator
+
+_TYPE_CHECKS = {
+    'string': 'isinstance(value, str)',
+    'integer': 'type(value) is int',
+    'number': 'type(value) in NUMBER_TYPES',
+    'boolean': 'type(value) is bool',
+    'array': 'isinstance(value, ARRAY_TYPES)',
+    'null': 'value is None',
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_source(source):
+    return compile(source, '<validictory>', 'exec')
+
+
+class _FunctionBuilder:
+
+    def __init__(self, validator, schema):
+        self.validator = validator
+        self.schema = schema
+        self.namespace = {
+            'schema': schema,
+            'NUMBER_TYPES': (int, float, Decimal),
+            'INT_FLOAT': (int, float),
+            'ARRAY_TYPES': (list, tuple),
+            'LENGTH_TYPES': (str, list, tuple),
+        }
+        self.lines = ['def validate(x, fieldname, path):',
+                      '    value = x.get(fieldname)']
+
+    def constant(self, value):
+        name = '_c{}'.format(len(self.namespace))
+        self.namespace[name] = value
+        return name
+
+    def call(self, method, value, guard=None):
+        method_name = self.constant(method)
+        value_name = self.constant(value)
+        call = f'{method_name}(x, fieldname, schema, path, {value_name})'
+        if guard is None:
+            self.lines.append('    ' + call)
+        else:
+            self.lines.append('    if ' + guard.format(value=value_name) + ':')
+            self.lines.append('        ' + call)
+
+    def step(self, method, value):
+        name = getattr(method, '__name__', '')
+        inline = getattr(self, '_inline_' + name[len('validate_'):], None)
+        overridden = getattr(method, '__func__', None) is not getattr(SchemaValidator, name, None)
+        if inline is None or overridden:
+            self.call(method, value)
+        else:
+            inline(method, value)
+
+    def build(self):
+        source = '\n'.join(self.lines) + '\n'
+        exec(_compile_source(source), self.namespace)
+        function = self.namespace['validate']
+        function.source = source
+        return function
+
+    def default_type(self, fieldtype):
+        ''' Tells if the type is checked by the validate_type_* method of SchemaValidator '''
+        checker = self.validator.type_checkers.get(fieldtype)
+        default = getattr(SchemaValidator, 'validate_type_' + fieldtype, None)
+        return checker is not None and getattr(checker, '__func__', None) is default
+
+    def _inline_type(self, method, fieldtype):
+        if isinstance(fieldtype, str) and self.default_type(fieldtype):
+            if fieldtype == 'any':
+                return
+            if fieldtype in _TYPE_CHECKS:
+                return self.call(method, fieldtype,
+                                 'not {} and fieldname in x'.format(_TYPE_CHECKS[fieldtype]))
+        self.call(method, fieldtype)
+
+    def _inline_required(self, method, required):
+        if required:
+            self.call(method, required, 'fieldname not in x')
+
+    def _inline_blank(self, method, blank):
+        if not blank:
+            self.call(method, blank, 'isinstance(value, str) and not value')
+
+    def _inline_minLength(self, method, length):
+        self.call(method, length, 'isinstance(value, LENGTH_TYPES) and len(value) < {value}')
+
+    def _inline_maxLength(self, method, length):
+        self.call(method, length, 'isinstance(value, LENGTH_TYPES) and len(value) > {value}')
+
+    def _inline_minimum(self, method, minimum):
+        if self.schema.get('exclusiveMinimum', False):
+            self.call(method, minimum, 'value is not None and value <= {value}')
+        else:
+            self.call(method, minimum, 'type(value) in INT_FLOAT and value < {value}')
+
+    def _inline_maximum(self, method, maximum):
+        if self.schema.get('exclusiveMaximum', False):
+            self.call(method, maximum, 'value is not None and value >= {value}')
+        else:
+            self.call(method, maximum, 'type(value) in INT_FLOAT and value > {value}')
+
+    def _inline_pattern(self, method, pattern):
+        try:
+            regex = self.validator._compile_regex(pattern) if isinstance(pattern, str) else pattern
+        except re.error:
+            # let validate_pattern report the broken pattern when it is used
+            return self.call(method, pattern)
+        self.call(method, pattern,
+                  'isinstance(value, str) and not {}.match(value)'.format(self.constant(regex)))
+
+    def _inline_title(self, method, title):
+        if not isinstance(title, (str, type(None))):
+            self.call(method, title)
+
+    _inline_description = _inline_title
+
+
+def generate_function(validator, schema, steps):
+    '''
+    Returns a function ``validate(x, fieldname, path)`` equivalent to calling
+    every ``(keyword, method, value)`` triple of ``steps`` for the field ``x[fieldname]``.
+    The generated source is available as the ``source`` attribute of the function.
+    '''
+    builder = _FunctionBuilder(validator, schema)
+    for keyword, method, value in steps:
+        builder.step(method, value)
+    return builder.build()
@@ -0,0 +1,67 @@
+'''
+Streaming validation of JSON Lines (also known as NDJSON) files, where every
+line holds one json document.  Lines are parsed and validated one at a time,
+so files of any size can be validated in constant memory.
+'''
+import contextlib
+import io
+import json
+import os
+
+from validictory.validator import SchemaValidator, ValidationError
+
+
+def validate_ndjson(source, schema, validator=None, max_invalid=None, rejects=None):
+    '''
+    Validates every line of a JSON Lines file against the provided schema.
+
+    This is a generator yielding a ``(line_number, document, errors)`` tuple
+    for every non-blank line, ``errors`` being the list of validation errors
+    of the document (empty if it is valid).  A line that isn't valid json is
+    reported with ``document`` set to None and a single :class:`ValidationError`.
+
+    :param source: file object (text or binary) or path of the file to read
+    :param schema: python dictionary representing the schema (see
+        :ref:`schema-format`)
+    :param validator: optional :class:`SchemaValidator` to validate with
+        (a default one is used otherwise)
+    :param max_invalid: optional number of invalid lines after which to stop
+    :param rejects: optional file object or path where invalid lines are
+        written unchanged, a path is opened in the same (text or binary) mode
+        as the source
+    '''
+    if validator is None:
+        validator = SchemaValidator()
+    # the schema is interpreted once for the whole file
+    validator.compile(schema)
+
+    with contextlib.ExitStack() as stack:
+        if isinstance(source, (str, os.PathLike)):
+            source = stack.enter_context(open(source, 'rb'))
+        if isinstance(rejects, (str, os.PathLike)):
+            mode = 'w' if isinstance(source, io.TextIOBase) else 'wb'
+            rejects = stack.enter_context(open(rejects, mode))
+
+        invalid = 0
+        for line_number, line in enumerate(source, 1):
+            if not line.strip():
+                continue
+
+            try:
+                document = json.loads(line)
+            except ValueError as e:
+                document = None
+                errors = [ValidationError(f"Line {line_number} is not valid json: {e}")]
+            else:
+                errors = validator._collect_errors(document, schema)
+
+            if errors:
+                invalid += 1
+                if rejects is not None:
+                    newline = b'\n' if isinstance(line, bytes) else '\n'
+                    rejects.write(line if line.endswith(newline) else line + newline)
+
+            yield line_number, document, errors
+
+            if max_invalid is not None and invalid >= max_invalid:
+                return
@@ -0,0 +1,63 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+import validictory
+
+
+async def aiter_documents(documents):
+    for document in documents:
+        await asyncio.sleep(0)
+        yield document
+
+
+class TestValidateAsync(IsolatedAsyncioTestCase):
+    schema = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "age": {"type": "integer"}
+        },
+    }
+    documents = [
+        {"name": "joe", "age": 42},
+        {"name": 2, "age": "fourty-two"},
+        {"name": "jane", "age": 37},
+    ]
+
+    async def test_validate_async(self):
+        await validictory.validate_async({"name": "joe", "age": 42}, self.schema)
+        with self.assertRaises(validictory.FieldValidationError):
+            await validictory.validate_async({"name": 2, "age": 42}, self.schema)
+        with self.assertRaises(validictory.MultipleValidationError):
+            await validictory.validate_async({"name": 2, "age": "x"}, self.schema,
+                                             fail_fast=False)
+
+    async def test_validate_async_doesnt_block_loop(self):
+        schema = {"type": "array", "items": self.schema}
+        data = [{"name": "joe", "age": 42}] * 20000
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.ensure_future(tick())
+        await asyncio.sleep(0)
+        ticks = 0
+        await validictory.validate_async(data, schema)
+        ticker.cancel()
+        self.assertGreater(ticks, 1)
+
+    async def test_compiled_validate_async(self):
+        compiled = validictory.compile(self.schema)
+        await compiled.validate_async(self.documents[0])
+        with self.assertRaises(validictory.ValidationError):
+            await compiled.validate_async(self.documents[1])
+
+    async def test_validate_many_async(self):
+        results = [errors async for errors in validictory.validate_many_async(
+                   aiter_documents(self.documents * 3), self.schema, chunksize=2,
+                   fail_fast=False)]
+        self.assertEqual([len(errors) for errors in results], [0, 2, 0] * 3)
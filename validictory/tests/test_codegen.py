@@ -0,0 +1,77 @@
+"""
+    Runs the rest of the test suite against schemas compiled with codegen=True
+"""
+
+import importlib
+import inspect
+import pkgutil
+from unittest import TestCase, mock
+
+import validictory
+import validictory.tests
+
+_validate = validictory.validate
+
+
+def codegen_validate(*args, **kwargs):
+    arguments = inspect.signature(_validate).bind(*args, **kwargs)
+    arguments.apply_defaults()
+    options = dict(arguments.arguments)
+    data = options.pop('data')
+    schema = options.pop('schema')
+    validator = options.pop('validator_cls')(**options)
+    return validator.compile(schema, codegen=True).validate(data)
+
+
+def _codegen_case(case):
+    class CodegenCase(case):
+        def run(self, result=None):
+            with mock.patch.object(validictory, 'validate', codegen_validate):
+                return super().run(result)
+
+    CodegenCase.__name__ = CodegenCase.__qualname__ = 'TestCodegen' + case.__name__
+    return CodegenCase
+
+
+for _info in pkgutil.iter_modules(validictory.tests.__path__):
+    if not _info.name.startswith('test_') or _info.name == __name__.rsplit('.', 1)[-1]:
+        continue
+    _module = importlib.import_module('validictory.tests.' + _info.name)
+    for _case in vars(_module).values():
+        if (isinstance(_case, type) and issubclass(_case, TestCase) and
+                _case.__module__ == _module.__name__):
+            _codegen = _codegen_case(_case)
+            globals()[_codegen.__name__] = _codegen
+
+
+class TestGeneratedSource(TestCase):
+
+    def test_inlined_checks(self):
+        schema = {"type": "string", "maxLength": 3, "pattern": "^a"}
+        validator = validictory.SchemaValidator()
+        validator.compile(schema, codegen=True)
+        source = validator._plans[id(schema)][2].source
+        self.assertIn("isinstance(value, str)", source)
+        self.assertIn("len(value) >", source)
+        self.assertIn(".match(value)", source)
+
+    def test_overridden_method_not_inlined(self):
+        class LengthValidator(validictory.SchemaValidator):
+            def validate_maxLength(self, x, fieldname, schema, path, length=None):
+                pass
+
+        schema = {"maxLength": 3}
+        validator = LengthValidator()
+        compiled = validator.compile(schema, codegen=True)
+        self.assertNotIn("len(value)", validator._plans[id(schema)][2].source)
+        compiled.validate("abcd")
+
+    def test_source_cached(self):
+        validator = validictory.SchemaValidator()
+        first, second = {"type": "string"}, {"type": "string"}
+        validator.compile(first, codegen=True)
+        validator.compile(second, codegen=True)
+        first_function = validator._plans[id(first)][2]
+        second_function = validator._plans[id(second)][2]
+        self.assertIsNot(first_function, second_function)
+        self.assertIs(first_function.__code__, second_function.__code__)
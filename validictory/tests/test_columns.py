@@ -0,0 +1,169 @@
+from decimal import Decimal
+from unittest import TestCase, mock, skipUnless
+
+import validictory
+from validictory.validator import _column_lists
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class FakeDataFrame:
+    ''' Implements the part of the pandas DataFrame interface used by validate_columns '''
+
+    def __init__(self, columns):
+        self.data = columns
+        self.columns = list(columns)
+
+    def to_dict(self, orient):
+        assert orient == 'list'
+        return {name: list(column) for name, column in self.data.items()}
+
+
+class FakeTable:
+    ''' Implements the part of the pyarrow Table interface used by validate_columns '''
+
+    def __init__(self, columns):
+        self.data = columns
+
+    def to_pydict(self):
+        return {name: list(column) for name, column in self.data.items()}
+
+
+class TestValidateColumns(TestCase):
+    schema = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "pattern": "^[a-z]+$", "maxLength": 8},
+            "age": {"type": "integer", "minimum": 0, "maximum": 150},
+            "score": {"type": "number", "minimum": 0, "exclusiveMaximum": True, "maximum": 1,
+                      "required": False},
+            "kind": {"type": "string", "enum": ["a", "b"], "blank": True},
+        },
+    }
+    columns = {
+        "name": ["joe", "jane", "X", "", "averylongname", 3, "ann"],
+        "age": [42, -1, 37, 12, 1.5, True, 20],
+        "score": [0.5, 0.25, 1, Decimal(0), -0.5, 0.0, 0.75],
+        "kind": ["a", "b", "c", "", ["a"], "a", "b"],
+    }
+
+    def rows(self, columns):
+        columns = _column_lists(columns)
+        names = list(columns)
+        return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+    def assertSameErrors(self, columns, schema, **options):
+        ''' Checks that validate_columns reports the same errors as validate_many on rows '''
+        results = validictory.validate_columns(columns, schema, **options)
+        expected = validictory.validate_many(self.rows(columns), schema, **options)
+        self.assertEqual([[str(e) for e in errors] for errors in results],
+                         [[str(e) for e in errors] for errors in expected])
+        return results
+
+    def test_validate_columns(self):
+        for fail_fast in (True, False):
+            results = self.assertSameErrors(self.columns, self.schema, fail_fast=fail_fast)
+            self.assertEqual([bool(errors) for errors in results],
+                             [False, True, True, True, True, True, False])
+
+    def test_flagged_rows(self):
+        validator = validictory.SchemaValidator()
+        with mock.patch.object(validator, '_collect_errors', return_value=[]) as collect:
+            validator.validate_columns(self.columns, self.schema)
+        self.assertEqual([call.args[0]['name'] for call in collect.call_args_list],
+                         ["jane", "X", "", "averylongname", 3])
+
+    def test_options(self):
+        for options in ({'blank_by_default': True}, {'required_by_default': False},
+                        {'disallow_unknown_properties': True},
+                        {'remove_unknown_properties': True}):
+            self.assertSameErrors(self.columns, self.schema, fail_fast=False, **options)
+
+    def test_missing_column(self):
+        columns = dict(self.columns)
+        del columns['age']
+        results = self.assertSameErrors(columns, self.schema, fail_fast=False)
+        self.assertTrue(all(results))
+
+        del columns['score']
+        columns['name'] = ['joe'] * 7
+        columns['kind'] = ['a'] * 7
+        self.assertSameErrors(columns, self.schema, required_by_default=False)
+
+    def test_additional_columns(self):
+        columns = dict(self.columns, extra=list(range(7)))
+        for additional in (True, False, {"type": "string"}):
+            schema = dict(self.schema, additionalProperties=additional)
+            self.assertSameErrors(columns, schema)
+        self.assertRaises(validictory.SchemaError, validictory.validate_columns, columns,
+                          self.schema, disallow_unknown_properties=True)
+
+    def test_unsupported_schema(self):
+        validator = validictory.SchemaValidator()
+        columns = {"name": ["joe"], "age": [42]}
+        for schema in ({"type": "object", "properties": {"name": {"format": "date"}}},
+                       {"type": "object", "properties": {"name": {"type": ["string", "null"]}}},
+                       {"type": "object", "properties": {"name": {"enum": lambda x: []}}},
+                       {"type": "object", "properties": {"age": {"minimum": "0"}}},
+                       {"type": "object", "properties": {"age": {"divisibleBy": 0}}},
+                       {"type": "object", "properties": {"name": {"pattern": "("}}},
+                       {"type": "object", "properties": {"name": "string"}},
+                       {"type": "object", "patternProperties": {}},
+                       {"type": "array"}):
+            self.assertIsNone(validator._flag_rows(columns, 1, schema))
+
+        schema = {"type": "object", "properties": {"name": {"type": "string",
+                                                            "format": "date"}}}
+        self.assertSameErrors({"name": ["2020-01-01", "x", 3]}, schema, fail_fast=False)
+
+    def test_schema_error(self):
+        self.assertRaises(validictory.SchemaError, validictory.validate_columns,
+                          {"age": [42]}, {"properties": {"age": {"divisibleBy": 0}}})
+
+    def test_lengths(self):
+        self.assertRaises(ValueError, validictory.validate_columns,
+                          {"name": ["joe"], "age": []}, self.schema)
+        self.assertEqual(validictory.validate_columns({}, self.schema), [])
+        self.assertEqual(validictory.validate_columns({"name": [], "age": []}, self.schema), [])
+
+    def test_dataframe_and_table(self):
+        expected = validictory.validate_columns(self.columns, self.schema, fail_fast=False)
+        for columns in (FakeDataFrame(self.columns), FakeTable(self.columns),
+                        {name: tuple(column) for name, column in self.columns.items()},
+                        {name: iter(column) for name, column in self.columns.items()}):
+            results = validictory.validate_columns(columns, self.schema, fail_fast=False)
+            self.assertEqual([[str(e) for e in errors] for errors in results],
+                             [[str(e) for e in errors] for errors in expected])
+
+    def test_compiled(self):
+        compiled = validictory.compile(self.schema, codegen=True)
+        results = compiled.validate_columns(self.columns)
+        self.assertEqual([len(errors) for errors in results], [0, 1, 1, 1, 1, 1, 0])
+
+    def test_stats(self):
+        stats = validictory.ValidationStats()
+        validator = validictory.SchemaValidator(stats=stats)
+        validator.validate_columns(self.columns, self.schema)
+        self.assertEqual(stats.keywords['properties'][0], 7)
+
+    def test_overridden_validator(self):
+        class EvenValidator(validictory.SchemaValidator):
+            def validate_minimum(self, x, fieldname, schema, path, minimum=None):
+                if x[fieldname] % 2:
+                    self._error('is odd', x[fieldname], fieldname, path=path)
+
+        schema = {"properties": {"age": {"type": "integer", "minimum": 0}}}
+        results = validictory.validate_columns({"age": [1, 2, 3]}, schema,
+                                               validator_cls=EvenValidator)
+        self.assertEqual([len(errors) for errors in results], [1, 0, 1])
+
+    @skipUnless(numpy, 'requires numpy')
+    def test_numpy_columns(self):
+        columns = {"age": numpy.arange(-5, 195), "score": numpy.linspace(0, 1, 200),
+                   "name": numpy.array(["joe"] * 200), "kind": ["a"] * 200}
+        results = self.assertSameErrors(columns, self.schema, fail_fast=False)
+        self.assertEqual([index for index, errors in enumerate(results) if errors],
+                         list(range(5)) + list(range(156, 200)))
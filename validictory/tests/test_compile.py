@@ -0,0 +1,157 @@
+from unittest import TestCase
+
+import validictory
+
+
+class TestCompile(TestCase):
+    schema = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "maxLength": 10},
+            "tags": {"type": "array", "items": {"type": "string"}},
+            "nickname": {"type": "string", "required": False},
+        },
+    }
+
+    def test_compile_pass(self):
+        compiled = validictory.compile(self.schema)
+        try:
+            compiled.validate({"name": "joe", "tags": ["a", "b"]})
+            compiled.validate({"name": "jim", "tags": []})
+        except ValueError as e:
+            self.fail("Unexpected failure: %s" % e)
+
+    def test_compile_fail(self):
+        compiled = validictory.compile(self.schema)
+        self.assertRaises(validictory.FieldValidationError, compiled.validate,
+                          {"name": "joe", "tags": ["a", 1]})
+        self.assertRaises(validictory.FieldValidationError, compiled.validate,
+                          {"name": "much too long", "tags": []})
+        self.assertRaises(validictory.ValidationError, compiled.validate,
+                          {"tags": []})
+
+    def test_compile_required_by_default(self):
+        compiled = validictory.compile(self.schema, required_by_default=False)
+        try:
+            compiled.validate({"name": "joe"})
+        except ValueError as e:
+            self.fail("Unexpected failure: %s" % e)
+
+    def test_compile_blank_by_default(self):
+        self.assertRaises(validictory.FieldValidationError,
+                          validictory.compile(self.schema).validate,
+                          {"name": "", "tags": []})
+        validictory.compile(self.schema, blank_by_default=True).validate(
+            {"name": "", "tags": []})
+
+    def test_compile_plans_subschemas(self):
+        validator = validictory.SchemaValidator()
+        compiled = validator.compile(self.schema)
+        self.assertIs(compiled.validator, validator)
+        self.assertIs(compiled.schema, self.schema)
+        for subschema in (self.schema, self.schema["properties"]["tags"],
+                          self.schema["properties"]["tags"]["items"]):
+            self.assertIs(validator._plans[id(subschema)][0], subschema)
+
+    def test_compile_invalid_subschema(self):
+        schema = {"type": "object", "properties": {"bar": "foo"}}
+        compiled = validictory.compile(schema)
+        with self.assertRaises(validictory.SchemaError) as cm:
+            compiled.validate({"bar": False})
+        self.assertEqual(str(cm.exception), "Type for field 'bar' must be 'dict', got: 'str'")
+
+    def test_compile_multiple_errors(self):
+        compiled = validictory.compile(self.schema, fail_fast=False)
+        with self.assertRaises(validictory.MultipleValidationError) as cm:
+            compiled.validate({"name": 1, "tags": [1, 2]})
+        self.assertEqual(len(cm.exception.errors), 3)
+
+
+class TestSchemaCache(TestCase):
+    # the function as defined, test_codegen replaces validictory.validate
+    validate = staticmethod(validictory.validate)
+
+    def setUp(self):
+        validictory.cache_clear()
+
+    def tearDown(self):
+        validictory.cache_clear()
+
+    def schema(self):
+        return {"type": "object", "properties": {"name": {"type": "string"}}}
+
+    def test_cache_hit(self):
+        for _ in range(3):
+            self.validate({"name": "joe"}, self.schema())
+        self.assertEqual(validictory.cache_info(), (2, 1, 128, 1))
+        self.assertRaises(validictory.FieldValidationError, self.validate, {"name": 1},
+                          self.schema())
+        self.assertEqual(validictory.cache_info().hits, 3)
+
+    def test_cache_clear(self):
+        self.validate({"name": "joe"}, self.schema())
+        validictory.cache_clear()
+        self.assertEqual(validictory.cache_info(), (0, 0, 128, 0))
+
+    def test_changed_schema(self):
+        schema = self.schema()
+        self.validate({"name": "joe"}, schema)
+        changed = self.schema()
+        changed["properties"]["name"]["type"] = "integer"
+        self.assertRaises(validictory.FieldValidationError, self.validate, {"name": "joe"},
+                          changed)
+        self.assertEqual(validictory.cache_info().misses, 2)
+
+        schema["properties"]["name"]["type"] = "integer"
+        self.assertRaises(validictory.FieldValidationError, self.validate, {"name": "joe"},
+                          schema)
+        self.assertEqual(validictory.cache_info(), (1, 2, 128, 2))
+
+    def test_leaf_types(self):
+        self.validate(1, {"enum": [1]})
+        self.validate(True, {"enum": [True]})
+        self.validate(1.0, {"enum": [1.0]})
+        self.assertEqual(validictory.cache_info().misses, 3)
+
+    def test_key_order(self):
+        first = {"type": "string", "maxLength": 2}
+        second = {"maxLength": 2, "type": "string"}
+        self.validate("a", first)
+        self.validate("a", second)
+        self.assertEqual(validictory.cache_info().currsize, 2)
+
+    def test_options(self):
+        self.validate({"name": "joe"}, self.schema())
+        self.validate({"name": "joe"}, self.schema(), fail_fast=False)
+        self.validate({}, self.schema(), required_by_default=False)
+        self.assertRaises(validictory.ValidationError, self.validate, {},
+                          self.schema())
+        self.assertEqual(validictory.cache_info()[:2], (1, 3))
+
+    def test_format_validators(self):
+        def validate_format_any(validator, fieldname, value, format_option):
+            pass
+
+        def validate_format_none(validator, fieldname, value, format_option):
+            raise validictory.FieldValidationError("never valid", fieldname, value)
+
+        schema = {"format": "custom"}
+        self.validate(1, schema, format_validators={"custom": validate_format_any})
+        self.assertRaises(validictory.FieldValidationError, self.validate, 1, schema,
+                          format_validators={"custom": validate_format_none})
+        self.validate(1, schema, format_validators={"custom": validate_format_any})
+        self.assertEqual(validictory.cache_info()[:2], (1, 2))
+
+    def test_unhashable_schema(self):
+        schema = {"enum": [{1}]}
+        self.validate({1}, schema)
+        self.validate({1}, schema)
+        self.assertEqual(validictory.cache_info().currsize, 0)
+
+    def test_bounded(self):
+        for length in range(200):
+            self.validate("a", {"type": "string", "maxLength": length + 1})
+        self.assertEqual(validictory.cache_info(), (0, 200, 128, 128))
+        self.validate("a", {"type": "string", "maxLength": 200})
+        self.validate("a", {"type": "string", "maxLength": 1})
+        self.assertEqual(validictory.cache_info()[:2], (1, 201))
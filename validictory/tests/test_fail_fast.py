@@ -1,3 +1,4 @@
+import threading
 from unittest import TestCase
 
 import validictory
@@ -117,3 +118,145 @@ class TestFailFast(TestCase):
             validictory.validate(data, schema, fail_fast=False)
         except validictory.MultipleValidationError as mve:
             assert len(mve.errors) == 3
+
+    def test_reused_validator(self):
+        schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+        validator = validictory.SchemaValidator(fail_fast=False)
+
+        for _ in range(3):
+            try:
+                validator.validate({"name": 2}, schema)
+            except validictory.MultipleValidationError as mve:
+                assert len(mve.errors) == 1
+
+        # earlier errors must not leak into the validation of a valid document
+        validator.validate({"name": "john doe"}, schema)
+
+    def test_shared_between_threads(self):
+        schema = {"type": "array", "items": {"type": "string"}}
+        validator = validictory.SchemaValidator(fail_fast=False)
+        counts = []
+
+        def validate(number):
+            for _ in range(50):
+                try:
+                    validator.validate([1] * number, schema)
+                except validictory.MultipleValidationError as mve:
+                    counts.append((number, len(mve.errors)))
+
+        threads = [threading.Thread(target=validate, args=(n,)) for n in range(1, 9)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(counts) == 8 * 50
+        assert all(number == errors for number, errors in counts)
+
+
+class CountedRepr:
+    ''' A value counting how many times it was formatted in a message '''
+    calls = 0
+
+    def __repr__(self):
+        CountedRepr.calls += 1
+        return 'counted'
+
+
+class TestMaxErrors(TestCase):
+    schema = {"type": "array", "items": {"type": "integer"}}
+
+    def test_max_errors(self):
+        with self.assertRaises(validictory.MultipleValidationError) as cm:
+            validictory.validate(["x"] * 1000, self.schema, fail_fast=False, max_errors=10)
+        self.assertEqual([e.path_parts for e in cm.exception.errors],
+                         [(index,) for index in range(10)])
+
+        with self.assertRaises(validictory.MultipleValidationError) as cm:
+            validictory.validate(["x"] * 5, self.schema, fail_fast=False, max_errors=10)
+        self.assertEqual(len(cm.exception.errors), 5)
+
+        with self.assertRaises(validictory.FieldValidationError):
+            validictory.validate(["x"] * 5, self.schema, max_errors=10)
+
+    def test_max_errors_formats(self):
+        validator = validictory.SchemaValidator(fail_fast=False, max_errors=2)
+        with self.assertRaises(validictory.MultipleValidationError) as cm:
+            validator.validate(["x"] * 10, {"items": {"format": "date"}})
+        self.assertEqual(len(cm.exception.errors), 2)
+
+    def test_max_errors_stops_traversal(self):
+        class CountingValidator(validictory.SchemaValidator):
+            calls = 0
+
+            def validate_type_integer(self, value):
+                CountingValidator.calls += 1
+                return super().validate_type_integer(value)
+
+        data = [1, "x", 2, "y", 3, "z", 4]
+        self.assertRaises(validictory.MultipleValidationError, validictory.validate, data,
+                          self.schema, validator_cls=CountingValidator, fail_fast=False,
+                          max_errors=2)
+        self.assertEqual(CountingValidator.calls, 4)
+
+    def test_max_errors_compiled(self):
+        for codegen in (False, True):
+            compiled = validictory.compile(self.schema, codegen=codegen, fail_fast=False,
+                                           max_errors=3)
+            results = compiled.validate_many([["x"] * 10, [1], ["x"]])
+            self.assertEqual([len(errors) for errors in results], [3, 0, 1])
+
+    def test_max_errors_in_type_union(self):
+        schema = {"type": "array", "items": {"type": [
+            {"type": "object", "properties": {"a": {"type": "string"},
+                                              "b": {"type": "string"},
+                                              "c": {"type": "string"}}},
+            "integer"]}}
+        data = [{"a": 1, "b": 2, "c": 3}, 4, {"a": "x", "b": "y", "c": "z"}, "w"]
+        with self.assertRaises(validictory.MultipleValidationError) as cm:
+            validictory.validate(data, schema, fail_fast=False, max_errors=2)
+        errors = cm.exception.errors
+        self.assertEqual([e.path_parts for e in errors], [(0,), (3,)])
+        self.assertIn("Value 1 for field '<obj>[0].a'", str(errors[0]))
+        self.assertNotIn("<obj>[0].c", str(errors[0]))
+
+    def test_lazy_messages(self):
+        CountedRepr.calls = 0
+        schema = {"type": "array", "items": {"type": "string", "enum": ["a"]}}
+        with self.assertRaises(validictory.MultipleValidationError) as cm:
+            validictory.validate([CountedRepr()] * 3, schema, fail_fast=False)
+        self.assertEqual(CountedRepr.calls, 0)
+
+        error = cm.exception.errors[2]
+        self.assertEqual(str(error), "Value counted for field '<obj>[1]' is not of type string")
+        self.assertEqual(CountedRepr.calls, 1)
+        self.assertEqual(str(error), "Value counted for field '<obj>[1]' is not of type string")
+        self.assertEqual(CountedRepr.calls, 1)
+        self.assertEqual(repr(error), 'FieldValidationError("Value counted for field '
+                                      '\'<obj>[1]\' is not of type string")')
+        self.assertTrue(str(cm.exception).startswith("6 validation errors:\n"))
+
+    def test_message_args(self):
+        with self.assertRaises(validictory.MultipleValidationError) as cm:
+            validictory.validate([1, "x"], self.schema, fail_fast=False)
+        error = cm.exception.errors[0]
+        self.assertEqual(error.args, ("Value 'x' for field '<obj>[1]' is not of type integer",))
+        self.assertIsInstance(cm.exception.args[0], str)
+
+    def test_message_value_when_found(self):
+        schema = {"type": "object", "maxProperties": 0,
+                  "properties": {"a": {"default": 1, "required": False}}}
+        with self.assertRaises(validictory.FieldValidationError) as cm:
+            validictory.validate({"b": 2}, schema, apply_default_to_data=True)
+        self.assertEqual(str(cm.exception), "Value {'b': 2} for field '<obj>' must have number "
+                                            "of properties less than or equal to 0")
+
+    def test_error_paths(self):
+        with self.assertRaises(validictory.FieldValidationError) as cm:
+            validictory.validate({"a": [0, "x"]}, {"properties": {"a": self.schema}})
+        error = cm.exception
+        self.assertEqual(error.path, "<obj>.a[1]")
+        self.assertEqual(error.path_parts, ("a", 1))
+        error.path = "elsewhere"
+        self.assertEqual(error.path, "elsewhere")
+        self.assertRaises(AttributeError, getattr, error, "message")
@@ -62,6 +62,13 @@ class TestItems(TestCase):
             # warning should mention list position
             assert '[0]' in str(e)
 
+    def test_items_multiple_errors(self):
+        data = ["a", 1, "b", 2.5]
+        with self.assertRaises(validictory.MultipleValidationError) as cm:
+            validictory.validate(data, self.schema1, fail_fast=False)
+        assert [(e.value, e.path) for e in cm.exception.errors] == [(1, '<obj>[1]'),
+                                                                    (2.5, '<obj>[3]')]
+
 
 class TestAdditionalItems(TestCase):
 
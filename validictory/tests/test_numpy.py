@@ -0,0 +1,130 @@
+import random
+from decimal import Decimal
+from unittest import TestCase, mock, skipUnless
+
+import validictory
+import validictory.validator
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+@skipUnless(numpy, 'requires numpy')
+class TestVectorizedItems(TestCase):
+    # the result of these tests doesn't depend on the patched function
+    validate = staticmethod(validictory.validate)
+
+    def errors(self, data, items, **options):
+        schema = {'type': 'array', 'items': items}
+        try:
+            self.validate(data, schema, **options)
+        except validictory.MultipleValidationError as e:
+            return [(str(error), error.path_parts) for error in e.errors]
+        except validictory.ValidationError as e:
+            return [(str(e), e.path_parts)]
+        return []
+
+    def assertSameErrors(self, data, items, **options):
+        ''' Checks that the fast path was used and reports what the slow path reports '''
+        flag_numeric_items = validictory.SchemaValidator._flag_numeric_items
+        with mock.patch.object(validictory.SchemaValidator, '_flag_numeric_items',
+                               autospec=True, side_effect=flag_numeric_items) as flag:
+            errors = self.errors(data, items, **options)
+        with mock.patch.object(validictory.validator, 'numpy', None):
+            expected = self.errors(data, items, **options)
+        self.assertEqual(errors, expected)
+        return errors, flag
+
+    def test_valid(self):
+        data = [random.random() for _ in range(1000)]
+        errors, flag = self.assertSameErrors(data, {'type': 'number', 'minimum': 0,
+                                                    'maximum': 1})
+        self.assertEqual(errors, [])
+        self.assertTrue(flag.called)
+
+    def test_invalid_indices(self):
+        random.seed(42)
+        data = [random.randint(-10, 100) for _ in range(500)]
+        for items in ({'type': 'integer', 'minimum': 0, 'maximum': 90},
+                      {'type': 'integer', 'minimum': 0, 'exclusiveMinimum': True},
+                      {'type': 'number', 'maximum': 50, 'exclusiveMaximum': True},
+                      {'type': 'number', 'divisibleBy': 3},
+                      {'divisibleBy': 0.5, 'minimum': -5.5, 'title': 'half'}):
+            for fail_fast in (True, False):
+                errors, _ = self.assertSameErrors(data, items, fail_fast=fail_fast)
+                self.assertTrue(errors)
+
+        errors, _ = self.assertSameErrors(data, {'type': 'integer', 'minimum': 0},
+                                          fail_fast=False)
+        self.assertEqual([path for _, path in errors],
+                         [(index,) for index, item in enumerate(data) if item < 0])
+
+    def test_flagged_indices(self):
+        validator = validictory.SchemaValidator()
+        data = [float(index) for index in range(100)]
+        data[7] = -1.0
+        data[42] = 2.5
+        self.assertEqual(validator._flag_numeric_items(
+            {'type': 'number', 'minimum': 0, 'divisibleBy': 1}, data), [7, 42])
+        self.assertEqual(validator._flag_numeric_items({'type': 'integer'}, data), None)
+
+    def test_wrong_types(self):
+        data = list(range(100))
+        for bad in (1.5, True, '1', None, Decimal(1), [1]):
+            data[50] = bad
+            for items in ({'type': 'integer', 'minimum': 0}, {'type': 'number', 'maximum': 99}):
+                self.assertSameErrors(data, items, fail_fast=False)
+
+    def test_fallbacks(self):
+        validator = validictory.SchemaValidator()
+        data = list(range(100))
+        self.assertEqual(validator._flag_numeric_items({'type': 'integer', 'minimum': 0},
+                                                       data), [])
+        for items in ({'type': 'string'},
+                      {'type': ['integer', 'null']},
+                      {'type': 'integer', 'enum': [1, 2]},
+                      {'type': 'integer', 'minimum': '0'},
+                      {'type': 'integer', 'minimum': 2 ** 70},
+                      {'type': 'integer', 'divisibleBy': 0},
+                      {'type': 'integer', 'title': 3}):
+            self.assertIsNone(validator._flag_numeric_items(items, data))
+        for bad in (2 ** 60, -2 ** 70, float('nan'), float('inf')):
+            self.assertIsNone(validator._flag_numeric_items({'type': 'number'}, data + [bad]))
+            self.assertSameErrors(data + [bad], {'type': 'number', 'maximum': 10 ** 30},
+                                  fail_fast=False)
+
+    def test_schema_errors(self):
+        data = list(range(100))
+        for items in ({'type': 'integer', 'divisibleBy': 0},
+                      {'type': 'integer', 'title': 3}):
+            self.assertRaises(validictory.SchemaError, self.validate,
+                              data, {'type': 'array', 'items': items})
+
+    def test_short_lists(self):
+        with mock.patch.object(validictory.SchemaValidator, '_flag_numeric_items') as flag:
+            self.validate(list(range(10)), {'type': 'array', 'items': {'type': 'integer'}})
+        self.assertFalse(flag.called)
+
+    def test_overridden_validator(self):
+        class PositiveValidator(validictory.SchemaValidator):
+            def validate_minimum(self, x, fieldname, schema, path, minimum=None):
+                if x[fieldname] <= minimum:
+                    self._error('is not positive', x[fieldname], fieldname, path=path)
+
+        validator = PositiveValidator()
+        data = list(range(100))
+        self.assertIsNone(validator._flag_numeric_items({'minimum': 0}, data))
+        self.assertRaises(validictory.FieldValidationError, validictory.validate, data,
+                          {'type': 'array', 'items': {'minimum': 0}},
+                          validator_cls=PositiveValidator)
+
+    def test_compiled(self):
+        data = list(range(-5, 100))
+        schema = {'type': 'array', 'items': {'type': 'integer', 'minimum': 0}}
+        for codegen in (False, True):
+            compiled = validictory.compile(schema, codegen=codegen, fail_fast=False)
+            with self.assertRaises(validictory.MultipleValidationError) as cm:
+                compiled.validate(data)
+            self.assertEqual([e.path_parts[-1] for e in cm.exception.errors], list(range(5)))
@@ -63,6 +63,100 @@ class TestFieldValidationErrors(TestCase):
             self.fail("No Exception")
 
 
+class TestValidatorClass(TestCase):
+    # the function as defined, test_codegen replaces validictory.validate
+    validate = staticmethod(validictory.validate)
+
+    class OldValidator(validictory.SchemaValidator):
+        ''' A subclass whose __init__ only takes the original options '''
+
+        def __init__(self, format_validators=None, required_by_default=True,
+                     blank_by_default=False, disallow_unknown_properties=False,
+                     apply_default_to_data=False, fail_fast=True,
+                     remove_unknown_properties=False):
+            super().__init__(format_validators, required_by_default, blank_by_default,
+                             disallow_unknown_properties, apply_default_to_data, fail_fast,
+                             remove_unknown_properties)
+
+    def test_original_options(self):
+        schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+        cls = self.OldValidator
+        self.validate({"name": "joe"}, schema, validator_cls=cls)
+        self.assertRaises(validictory.MultipleValidationError, self.validate, {"name": 1},
+                          schema, validator_cls=cls, fail_fast=False)
+        self.assertEqual(len(validictory.validate_many([{"name": 1}], schema, validator_cls=cls,
+                                                       required_by_default=False)[0]), 1)
+        self.assertEqual(validictory.validate_columns({"name": [1, "joe"]}, schema,
+                                                      validator_cls=cls)[1], [])
+        validictory.compile(schema, validator_cls=cls, codegen=True).validate({"name": "joe"})
+
+        # the options it doesn't know about can't be used
+        self.assertRaises(TypeError, self.validate, {"name": "joe"}, schema,
+                          validator_cls=cls, max_errors=10)
+
+    def test_errors_reset(self):
+        class ResettingValidator(validictory.SchemaValidator):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self._errors = []
+
+        validator = ResettingValidator(fail_fast=False)
+        with self.assertRaises(validictory.MultipleValidationError) as cm:
+            validator.validate({"a": 1, "b": 2}, {"properties": {"a": {"type": "string"},
+                                                                 "b": {"type": "string"}}})
+        self.assertEqual(len(cm.exception.errors), 2)
+        self.assertEqual(validator._errors, [])
+
+
+class TestDispatch(TestCase):
+
+    def test_tables(self):
+        validator = validictory.SchemaValidator()
+        self.assertEqual(validator.keywords['maxLength'], validator.validate_maxLength)
+        self.assertEqual(validator.type_checkers['string'], validator.validate_type_string)
+        for name in ('many', 'async', 'many_async', 'type_string'):
+            self.assertNotIn(name, validator.keywords)
+
+    def test_method_names_are_not_keywords(self):
+        validictory.SchemaValidator().validate([1], {"many": True, "async": None})
+
+    def test_subclass(self):
+        class EvenValidator(validictory.SchemaValidator):
+            def validate_even(self, x, fieldname, schema, path, even=None):
+                if even and x.get(fieldname) % 2:
+                    self._error("is odd", x.get(fieldname), fieldname, path=path)
+
+            def validate_type_integer(self, value):
+                return isinstance(value, int) and not isinstance(value, bool)
+
+        validator = EvenValidator()
+        self.assertEqual(validator.keywords['even'], validator.validate_even)
+        validator.validate(2, {"even": True, "type": "integer"})
+        self.assertRaises(validictory.FieldValidationError, validator.validate, 3,
+                          {"even": True})
+        # other validators are unchanged
+        validictory.SchemaValidator().validate(3, {"even": True})
+
+    def test_extend_tables(self):
+        def validate_even(x, fieldname, schema, path, even=None):
+            if even and x.get(fieldname) % 2:
+                raise validictory.FieldValidationError("is odd", fieldname, x.get(fieldname))
+
+        validator = validictory.SchemaValidator()
+        validator.keywords['even'] = validate_even
+        validator.type_checkers['positive'] = lambda value: value > 0
+        validator.type_checkers['string'] = lambda value: isinstance(value, (str, bytes))
+
+        for codegen in (False, True):
+            compiled = validator.compile({"type": "positive", "even": True}, codegen=codegen)
+            compiled.validate(2)
+            self.assertRaises(validictory.FieldValidationError, compiled.validate, 3)
+            self.assertRaises(validictory.FieldValidationError, compiled.validate, -2)
+
+            compiled = validator.compile({"type": "string"}, codegen=codegen)
+            compiled.validate(b"bytes")
+
+
 def test_deep_required_error():
     schema = {'type': 'object', 'properties': {'foo': {'type': 'object',
               'properties': {'bar': {'type': 'integer', 'required': 'true'}}}}}
@@ -91,3 +185,47 @@ def test_deep_error():
         assert 'foo' in estr
         assert 'bar' in estr
         assert '1' in estr
+
+
+def test_error_path_parts():
+    schema = {'type': 'object', 'properties': {'foo': {'type': 'object', 'properties':
+                                                       {'bar': {'type': 'array', 'items':
+                                                                {'type': 'object', 'properties':
+                                                                 {'baz': {'type': 'string'}}}}}}}}
+    data = {'foo': {'bar': [{'baz': 'a'}, {'baz': 1}, {}]}}
+    try:
+        validictory.validate(data, schema, fail_fast=False)
+    except validictory.MultipleValidationError as mve:
+        type_error, required_error = mve.errors
+    assert type_error.path == '<obj>.foo.bar[1].baz'
+    assert type_error.path_parts == ('foo', 'bar', 1, 'baz')
+    assert required_error.path == '<obj>.foo.bar[2].baz'
+    assert required_error.fieldname == '<obj>.foo.bar[2].baz'
+    assert required_error.path_parts == ('foo', 'bar', 2, 'baz')
+
+
+def test_default_rules_order():
+    calls = []
+
+    class RecordingValidator(validictory.SchemaValidator):
+        def validate_type(self, x, fieldname, schema, path, fieldtype=None):
+            calls.append(('type', schema, fieldtype))
+
+        def validate_required(self, x, fieldname, schema, path, required=False):
+            calls.append(('required', schema, required))
+
+        def validate_blank(self, x, fieldname, schema, path, blank=False):
+            calls.append(('blank', schema, blank))
+
+    schema = {'type': 'string'}
+    RecordingValidator().validate('x', schema)
+    # the default rules are applied last, and to the schema itself rather than a copy
+    assert calls == [('type', schema, 'string'), ('required', schema, True),
+                     ('blank', schema, False)]
+    assert [call[1] is schema for call in calls] == [True, True, True]
+    assert schema == {'type': 'string'}
+
+    calls.clear()
+    schema = {'blank': True, 'type': 'string'}
+    RecordingValidator(required_by_default=False).validate('x', schema)
+    assert calls == [('blank', schema, True), ('type', schema, 'string')]
@@ -114,6 +114,42 @@ class TestPatternProperties(TestCase):
         except ValueError as e:
             self.fail("Unexpected failure: %s" % e)
 
+    def test_patternproperties_multiple_patterns(self):
+        schema = {'patternProperties': {'^a': {'type': 'boolean'},
+                                        '^[ab]': {'type': 'boolean'},
+                                        r'(x)\1': {'type': 'integer'}}}
+
+        try:
+            validictory.validate({'a': True, 'b': False, 'xx': 1, 'xy': 'foo'}, schema)
+        except ValueError as e:
+            self.fail("Unexpected failure: %s" % e)
+
+        self.assertRaises(ValueError, validictory.validate, {'b': 1}, schema)
+        self.assertRaises(ValueError, validictory.validate, {'xx': 'foo'}, schema)
+
+    def test_patternproperties_fieldname(self):
+        with self.assertRaises(validictory.FieldValidationError) as cm:
+            validictory.validate({'a': True, 'b': 'foo'}, self.schema)
+        self.assertEqual(cm.exception.fieldname, 'b')
+        self.assertEqual(cm.exception.value, 'foo')
+
+    def test_patternproperties_nondict(self):
+        schema = {'patternProperties': {'^a': {'type': 'boolean'}, '^b': {'type': 'boolean'}}}
+        for data in ('abc', ['a', 'b'], 123, None):
+            validictory.validate(data, self.schema)
+            validictory.validate(data, schema)
+
+    def test_patternproperties_regex_cache(self):
+        validator = validictory.SchemaValidator(regex_cache_size=1)
+        validator.validate({'a': True, 'b': False}, self.schema)
+        validator.validate({'c': True}, self.schema)
+        self.assertEqual(validator._compile_regex.cache_info().hits, 1)
+        self.assertEqual(validator._compile_regex.cache_info().currsize, 1)
+
+        validator.validate({'a': True}, {'patternProperties': {'a': {}}})
+        self.assertEqual(validator._compile_regex.cache_info().currsize, 1)
+        self.assertEqual(validator._compile_regex.cache_info().misses, 2)
+
 
 class TestMinMaxProperties(TestCase):
     def test_min_properties_pass(self):
@@ -256,6 +292,18 @@ class TestAdditionalProperties(TestCase):
             except ValueError as e:
                 self.fail("Unexpected failure: %s" % e)
 
+    def test_with_multiple_pattern_properties(self):
+        schema = {"properties": {"prop1": {}},
+                  "patternProperties": {"^a": {}, "^b": {}, "(?i)^c": {}},
+                  "additionalProperties": False}
+
+        try:
+            validictory.validate({"prop1": 1, "a1": 1, "b1": 1, "c1": 1, "C2": 1}, schema)
+        except ValueError as e:
+            self.fail("Unexpected failure: %s" % e)
+
+        self.assertRaises(ValueError, validictory.validate, {"prop1": 1, "d": 1}, schema)
+
     def test_false(self):
         schema = {"additionalProperties": False}
 
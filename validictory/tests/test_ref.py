@@ -0,0 +1,141 @@
+from unittest import TestCase
+
+import validictory
+
+
+class TestRef(TestCase):
+    tree = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "children": {"type": "array", "required": False, "items": {"$ref": "#"}},
+        },
+    }
+    definitions = {
+        "type": "array",
+        "items": {"$ref": "#/definitions/positive"},
+        "definitions": {
+            "positive": {"type": "integer", "minimum": 1},
+            "a/b~c": {"type": "string"},
+        },
+    }
+    address = {
+        "id": "http://example.com/address",
+        "type": "object",
+        "properties": {
+            "city": {"type": "string"},
+            "zip": {"$ref": "#/definitions/zip"},
+        },
+        "definitions": {
+            "zip": {"type": "string", "pattern": "^[0-9]{5}$"},
+        },
+    }
+
+    def test_local_root(self):
+        data = {"name": "root", "children": [{"name": "a", "children": [{"name": "b"}]}]}
+        validictory.validate(data, self.tree)
+
+        data["children"][0]["children"][0]["name"] = 1
+        with self.assertRaises(validictory.FieldValidationError) as cm:
+            validictory.validate(data, self.tree)
+        self.assertEqual(cm.exception.path_parts, ("children", 0, "children", 0, "name"))
+
+    def test_local_pointer(self):
+        validictory.validate([1, 2, 3], self.definitions)
+        self.assertRaises(validictory.FieldValidationError, validictory.validate, [1, 0],
+                          self.definitions)
+
+    def test_pointer_escapes(self):
+        for ref in ["#/definitions/a~1b~0c", "#/definitions/a~1b%7E0c"]:
+            schema = dict(self.definitions, items={"$ref": ref})
+            validictory.validate(["x"], schema)
+            self.assertRaises(validictory.FieldValidationError, validictory.validate, [1],
+                              schema)
+
+    def test_pointer_into_array(self):
+        schema = {"type": "array", "items": {"$ref": "#/definitions/1"},
+                  "definitions": [{"type": "string"}, {"type": "integer"}]}
+        validictory.validate([1, 2], schema)
+        self.assertRaises(validictory.FieldValidationError, validictory.validate, ["x"], schema)
+
+    def test_ref_replaces_schema(self):
+        schema = dict(self.definitions, items={"$ref": "#/definitions/positive",
+                                               "type": "string"})
+        validictory.validate([1], schema)
+
+    def test_registered_schema(self):
+        validator = validictory.SchemaValidator()
+        validator.register_schema(self.address)
+        schema = {"type": "array", "items": {"$ref": "http://example.com/address#"}}
+        validator.validate([{"city": "Paris", "zip": "75001"}], schema)
+        self.assertRaises(validictory.FieldValidationError, validator.validate,
+                          [{"city": "Paris", "zip": "750"}], schema)
+
+        schema = {"$ref": "http://example.com/address#/definitions/zip"}
+        validator.validate("75001", schema)
+        self.assertRaises(validictory.FieldValidationError, validator.validate, "750", schema)
+
+    def test_relative_to_id(self):
+        validator = validictory.SchemaValidator()
+        validator.register_schema(self.address)
+        schema = {"id": "http://example.com/person", "properties": {"address": {
+            "$ref": "address"}}}
+        validator.validate({"address": {"city": "Paris", "zip": "75001"}}, schema)
+
+    def test_register_schema_with_uri(self):
+        validator = validictory.SchemaValidator()
+        validator.register_schema({"type": "integer"}, "urn:integer")
+        validator.validate(1, {"$ref": "urn:integer"})
+        self.assertRaises(validictory.SchemaError, validator.register_schema,
+                          {"type": "integer"})
+
+    def test_register_nested_id(self):
+        validator = validictory.SchemaValidator()
+        validator.register_schema({"id": "http://example.com/root",
+                                   "definitions": {"id": {"id": "id#", "type": "integer"}}})
+        validator.validate(1, {"$ref": "http://example.com/id"})
+
+    def test_unresolvable(self):
+        for ref in ["#/definitions/missing", "#/definitions/positive/x",
+                    "http://example.com/unknown#", 1]:
+            schema = {"type": "array", "items": {"$ref": ref}}
+            self.assertRaises(validictory.SchemaError, validictory.validate, [1], schema)
+
+    def test_cycle(self):
+        for schema, data in (({"$ref": "#"}, 1),
+                             ({"$ref": "#/a", "a": {"$ref": "#/b"}, "b": {"$ref": "#/a"}}, 1),
+                             ({"properties": {"a": {"$ref": "#/properties/a"}}}, {"a": 1})):
+            self.assertRaises(validictory.SchemaError, validictory.validate, data, schema)
+            self.assertRaises(validictory.SchemaError, validictory.compile, schema)
+
+        # cycles through other keywords are only found when validating
+        schema = {"type": [{"$ref": "#"}, "string"]}
+        for fail_fast in (True, False):
+            for codegen in (False, True):
+                compiled = validictory.compile(schema, codegen=codegen, fail_fast=fail_fast)
+                self.assertRaises(validictory.SchemaError, compiled.validate, 1)
+            validator = validictory.SchemaValidator(fail_fast=fail_fast)
+            self.assertRaises(validictory.SchemaError, validator.validate, 1, schema)
+
+        # the data consumed by references between two visits of a schema is what ends them
+        validictory.validate("x", {"type": [{"$ref": "#"}, "string"]})
+        validictory.validate([[[]]], {"type": "array", "items": {"$ref": "#"}})
+
+    def test_compiled(self):
+        validator = validictory.SchemaValidator()
+        compiled = validator.compile(self.definitions)
+        compiled.validate([1, 2])
+        self.assertRaises(validictory.FieldValidationError, compiled.validate, [0])
+
+        # the reference was resolved when compiling
+        positive = self.definitions["definitions"]["positive"]
+        steps = validator._plans[id(self.definitions["items"])][1]
+        self.assertEqual(steps, (('$ref', validator._validate_resolved_ref, (positive, None)),))
+        self.assertIn(id(positive), validator._plans)
+
+    def test_compiled_registered_later(self):
+        validator = validictory.SchemaValidator()
+        compiled = validator.compile({"$ref": "http://example.com/address#"})
+        self.assertRaises(validictory.SchemaError, compiled.validate, {"city": "Paris"})
+        validator.register_schema(self.address)
+        compiled.validate({"city": "Paris", "zip": "75001"})
@@ -182,3 +182,8 @@ class TestSchemaSchema(TestCase):
 
     def test_schema(self):
         validictory.validate(schema, schema, required_by_default=False)
+
+    def test_invalid_subschema(self):
+        invalid = {"properties": {"name": {"type": "string", "minLength": "1"}}}
+        self.assertRaises(validictory.ValidationError, validictory.validate, invalid, schema,
+                          required_by_default=False)
@@ -0,0 +1,95 @@
+import pickle
+from unittest import TestCase
+
+import validictory
+
+
+class TestStats(TestCase):
+    schema = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "pattern": "^[a-z]+$"},
+            "created": {"type": "string", "format": "date"},
+            "tags": {"type": "array", "items": {"type": "string"}},
+        },
+    }
+    data = {"name": "joe", "created": "2020-01-01", "tags": ["a", "b", "c"]}
+
+    def test_stats(self):
+        stats = validictory.ValidationStats()
+        validator = validictory.SchemaValidator(stats=stats)
+        validator.validate(self.data, self.schema)
+
+        self.assertEqual(stats.keywords["pattern"][0], 1)
+        self.assertEqual(stats.keywords["format"][0], 1)
+        self.assertEqual(stats.keywords["format:date"][0], 1)
+        self.assertEqual(stats.keywords["items"][0], 1)
+        # the object, its three properties and the three items
+        self.assertEqual(stats.keywords["type"][0], 7)
+        self.assertEqual(stats.paths["<obj>.tags[]"][0], 9)
+        self.assertGreater(stats.keywords["properties"][1], stats.keywords["pattern"][1])
+
+        stats.clear()
+        self.assertEqual(stats.keywords, {})
+        self.assertEqual(stats.paths, {})
+
+    def test_stats_compiled(self):
+        for codegen in (False, True):
+            stats = validictory.ValidationStats()
+            validator = validictory.SchemaValidator(stats=stats)
+            validator.compile(self.schema, codegen=codegen).validate(self.data)
+            self.assertEqual(stats.keywords["type"][0], 7)
+            self.assertEqual(stats.keywords["required"][0], 7)
+
+    def test_stats_errors(self):
+        stats = validictory.ValidationStats()
+        validator = validictory.SchemaValidator(stats=stats, fail_fast=False)
+        data = {"name": "Joe", "created": "2020-13-01", "tags": [1]}
+        with self.assertRaises(validictory.MultipleValidationError) as cm:
+            validator.validate(data, self.schema)
+        self.assertEqual(len(cm.exception.errors), 3)
+        self.assertEqual(stats.keywords["format:date"][0], 1)
+
+        stats.clear()
+        validator = validictory.SchemaValidator(stats=stats)
+        self.assertRaises(validictory.FieldValidationError, validator.validate, data,
+                          self.schema)
+        self.assertEqual(stats.keywords["pattern"][0], 1)
+
+    def test_stats_ref(self):
+        stats = validictory.ValidationStats()
+        validator = validictory.SchemaValidator(stats=stats)
+        validator.validate([1], {"items": {"$ref": "#/definitions/int"},
+                                 "definitions": {"int": {"type": "integer"}}})
+        self.assertEqual(stats.keywords["$ref"][0], 1)
+        self.assertEqual(stats.paths["<obj>[]"][0], 4)
+
+    def test_stats_keyword_names(self):
+        stats = validictory.ValidationStats()
+        validator = validictory.SchemaValidator(stats=stats)
+        validator.keywords["even"] = lambda x, fieldname, schema, path, value: None
+        validator.validate([1, 2], {"minItems": 1, "maxItems": 3, "even": True})
+        self.assertEqual(sorted(stats.keywords),
+                         ["blank", "even", "maxItems", "minItems", "required"])
+
+    def test_record_callback(self):
+        records = []
+
+        class Recorder:
+            def record(self, keyword, path, elapsed):
+                records.append((keyword, path))
+
+        validator = validictory.SchemaValidator(stats=Recorder())
+        validator.validate({"name": "joe"}, {"properties": {"name": {"type": "string"}}})
+        self.assertEqual(records, [("type", "<obj>.name"), ("required", "<obj>.name"),
+                                   ("blank", "<obj>.name"), ("properties", "<obj>"),
+                                   ("required", "<obj>"), ("blank", "<obj>")])
+
+    def test_pickle(self):
+        stats = validictory.ValidationStats()
+        validator = validictory.SchemaValidator(stats=stats)
+        validator.validate(self.data, self.schema)
+        copy = pickle.loads(pickle.dumps(validator))
+        copy.validate(self.data, self.schema)
+        self.assertEqual(copy.stats.keywords["pattern"][0], 2)
+        self.assertEqual(stats.keywords["pattern"][0], 1)
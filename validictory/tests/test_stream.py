@@ -0,0 +1,73 @@
+import io
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+import validictory
+from validictory.stream import validate_ndjson
+
+LINES = '''{"name": "joe", "age": 42}
+{"name": 2, "age": 42}
+
+{"name": "jane", "age": "unknown"}
+not json
+{"name": "jim", "age": 12}'''
+
+
+class TestValidateNdjson(TestCase):
+    schema = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "age": {"type": "integer"}
+        },
+    }
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_text_file(self):
+        results = list(validate_ndjson(io.StringIO(LINES), self.schema))
+        self.assertEqual([(n, len(errors)) for n, _, errors in results],
+                         [(1, 0), (2, 1), (4, 1), (5, 1), (6, 0)])
+        self.assertEqual(results[0][1], {"name": "joe", "age": 42})
+        self.assertIsNone(results[3][1])
+        self.assertIsInstance(results[1][2][0], validictory.FieldValidationError)
+        self.assertIsInstance(results[3][2][0], validictory.ValidationError)
+
+    def test_path(self):
+        path = os.path.join(self.tmpdir, 'data.jsonl')
+        with open(path, 'w') as f:
+            f.write(LINES)
+        results = list(validate_ndjson(path, self.schema))
+        self.assertEqual([n for n, _, errors in results if errors], [2, 4, 5])
+
+    def test_validator(self):
+        validator = validictory.SchemaValidator(fail_fast=False)
+        lines = io.BytesIO(b'{"name": 1, "age": "x"}\n{"name": 1, "age": 1}\n')
+        results = list(validate_ndjson(lines, self.schema, validator=validator))
+        self.assertEqual([len(errors) for _, _, errors in results], [2, 1])
+
+    def test_max_invalid(self):
+        results = list(validate_ndjson(io.StringIO(LINES), self.schema, max_invalid=2))
+        self.assertEqual([n for n, _, _ in results], [1, 2, 4])
+
+    def test_rejects(self):
+        rejects = io.StringIO()
+        list(validate_ndjson(io.StringIO(LINES), self.schema, rejects=rejects))
+        self.assertEqual(rejects.getvalue(), '{"name": 2, "age": 42}\n'
+                                             '{"name": "jane", "age": "unknown"}\n'
+                                             'not json\n')
+
+    def test_rejects_path(self):
+        path = os.path.join(self.tmpdir, 'data.jsonl')
+        rejects = os.path.join(self.tmpdir, 'rejects.jsonl')
+        with open(path, 'w') as f:
+            f.write(LINES)
+        list(validate_ndjson(path, self.schema, rejects=rejects, max_invalid=1))
+        with open(rejects) as f:
+            self.assertEqual(f.read(), '{"name": 2, "age": 42}\n')
@@ -116,6 +116,42 @@ class TestDisallow(TestType):
                               {"disallow": typename})
 
 
+class TestTypeUnion(TestCase):
+    object_schema = {"type": "object", "properties": {"a": {"type": "string"},
+                                                      "b": {"type": "string"}}}
+
+    def test_names_before_schemas(self):
+        schema = {"type": [self.object_schema, "object"]}
+        validictory.validate({"a": 1, "b": 2}, schema)
+
+        # errors are reported in the order of the types
+        with self.assertRaises(validictory.FieldValidationError) as cm:
+            validictory.validate(1, {"type": [self.object_schema, "foo", "string"]})
+        errorlist = str(cm.exception).split("errorlist = ")[1]
+        self.assertLess(errorlist.index("is not of type object"),
+                        errorlist.index("is not supported"))
+        self.assertLess(errorlist.index("is not supported"),
+                        errorlist.index("is not of type string"))
+
+    def test_schema_errors_scoped(self):
+        schema = {"type": [self.object_schema, "string"]}
+        with self.assertRaises(validictory.MultipleValidationError) as cm:
+            validictory.validate({"a": 1, "b": 2}, schema, fail_fast=False)
+        # the errors of the schema are only reported as part of the union's error
+        self.assertEqual(len(cm.exception.errors), 1)
+        self.assertIn("'<obj>.a' is not of type string", str(cm.exception.errors[0]))
+        self.assertIn("'<obj>.b' is not of type string", str(cm.exception.errors[0]))
+
+        validictory.validate({"a": "x", "b": "y"}, schema, fail_fast=False)
+
+    def test_in_order_when_changing_data(self):
+        schema = {"type": [{"type": "object", "properties": {
+            "a": {"type": "string", "default": "x"}}}, "object"]}
+        data = {}
+        validictory.validate(data, schema, apply_default_to_data=True)
+        self.assertEqual(data, {"a": "x"})
+
+
 class DateValidator(validictory.validator.SchemaValidator):
 
     def validate_type_date(self, value):
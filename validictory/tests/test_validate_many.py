@@ -0,0 +1,74 @@
+import pickle
+from unittest import TestCase
+
+import validictory
+
+
+class TestValidateMany(TestCase):
+    schema = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "age": {"type": "integer"}
+        },
+    }
+    documents = [
+        {"name": "joe", "age": 42},
+        {"name": 2, "age": "fourty-two"},
+        {"name": "jane", "age": 37},
+        {"age": 12},
+    ]
+
+    def test_validate_many(self):
+        results = validictory.validate_many(self.documents, self.schema)
+        self.assertEqual([len(errors) for errors in results], [0, 1, 0, 1])
+        self.assertIsInstance(results[1][0], validictory.FieldValidationError)
+        self.assertEqual(results[1][0].fieldname, "name")
+
+    def test_validate_many_not_fail_fast(self):
+        results = validictory.validate_many(self.documents, self.schema, fail_fast=False)
+        self.assertEqual([len(errors) for errors in results], [0, 2, 0, 1])
+        self.assertEqual([e.fieldname for e in results[1]], ["name", "age"])
+
+    def test_validate_many_generator(self):
+        results = validictory.validate_many(iter(self.documents), self.schema)
+        self.assertEqual(len(results), 4)
+
+    def test_validate_many_reused_validator(self):
+        validator = validictory.SchemaValidator(fail_fast=False)
+        first = validator.validate_many(self.documents, self.schema)
+        second = validator.validate_many(self.documents[2:], self.schema)
+        self.assertEqual([len(errors) for errors in first], [0, 2, 0, 1])
+        self.assertEqual([len(errors) for errors in second], [0, 1])
+
+    def test_validate_many_schema_error(self):
+        self.assertRaises(validictory.SchemaError, validictory.validate_many,
+                          self.documents, {"properties": {"name": "string"}})
+
+    def test_validate_many_workers(self):
+        documents = self.documents * 50
+        results = validictory.validate_many(documents, self.schema, fail_fast=False,
+                                            workers=2, chunksize=7)
+        expected = validictory.validate_many(documents, self.schema, fail_fast=False)
+        self.assertEqual([[str(e) for e in errors] for errors in results],
+                         [[str(e) for e in errors] for errors in expected])
+        self.assertEqual([e.path for e in results[-3]], ["<obj>.name", "<obj>.age"])
+        self.assertEqual([e.fieldname for e in results[-3]], ["name", "age"])
+
+    def test_validate_many_workers_schema_error(self):
+        self.assertRaises(validictory.SchemaError, validictory.validate_many,
+                          self.documents, {"properties": {"name": "string"}}, workers=2)
+
+    def test_errors_pickle(self):
+        results = validictory.validate_many(self.documents, self.schema, fail_fast=False)
+        for error in results[1] + results[3]:
+            copy = pickle.loads(pickle.dumps(error))
+            self.assertIs(type(copy), type(error))
+            self.assertEqual(str(copy), str(error))
+            self.assertEqual(copy.fieldname, error.fieldname)
+            self.assertEqual(copy.path, error.path)
+
+        mve = validictory.MultipleValidationError(results[1])
+        copy = pickle.loads(pickle.dumps(mve))
+        self.assertEqual(str(copy), str(mve))
+        self.assertEqual(len(copy.errors), 2)
@@ -2,7 +2,10 @@
     Tests that test the value of individual items
 """
 
+import datetime
+import pickle
 import re
+import socket
 from unittest import TestCase
 
 import validictory
@@ -35,6 +38,26 @@ class TestEnum(TestCase):
 
         self.assertRaises(ValueError, validictory.validate, data, self.schema)
 
+    def test_enum_compiled(self):
+        schema = {"enum": ["test", True, 123, ["???"], {"a": 1}, (1, 2)]}
+        validator = validictory.SchemaValidator()
+        compiled = validator.compile(schema)
+        self.assertIn(id(schema["enum"]), validator._enums)
+        for item in ["test", True, 1, 123.0, ["???"], {"a": 1}, (1, 2)]:
+            compiled.validate(item)
+        for item in ["unknown", 2, ["!!!"], {"a": 2}, [1, 2], {1}]:
+            self.assertRaises(ValueError, compiled.validate, item)
+
+    def test_enum_callable(self):
+        def options(x):
+            return ["a", "b"] if x.get("ab") else ["c"]
+
+        schema = {"properties": {"value": {"enum": options}}}
+        compiled = validictory.compile(schema, required_by_default=False)
+        compiled.validate({"value": "c"})
+        compiled.validate({"value": "a", "ab": True})
+        self.assertRaises(ValueError, compiled.validate, {"value": "a"})
+
 
 class TestPattern(TestCase):
 
@@ -104,6 +127,9 @@ class TestFormat(TestCase):
     schema_time = {"format": "time"}
     schema_utcmillisec = {"format": "utc-millisec"}
     schema_ip = {"format": "ip-address"}
+    schema_ipv6 = {"format": "ipv6"}
+    schema_hostname = {"format": "hostname"}
+    schema_uri = {"format": "uri"}
     schema_spaces = {"format": "spaces"}
     schema_non_empty_dict = {"type": "object", "format": "non-empty-dict"}
 
@@ -169,6 +195,54 @@ class TestFormat(TestCase):
         self.assertRaises(ValueError, validictory.validate, data,
                           self.schema_datetime)
 
+    def test_format_datetime_same_as_strptime(self):
+        datetime_formats = {"date-time": "%Y-%m-%dT%H:%M:%SZ", "date": "%Y-%m-%d",
+                            "time": "%H:%M:%S"}
+        values = ["2012-02-29", "2011-02-29", "0000-01-01", "2011-1-1", "2011-01- 1",
+                  "2011-12-32", "2011-01-01T00:00:00Z", "2011-01-01t00:00:00z",
+                  "2011-01-01T24:00:00Z", "2011-01-01T23:59:60Z", "2011-01-01T1:2:3Z",
+                  "2011-01-01T00:00:00.123456Z", "2011-01-01T00:00:00.1234567Z",
+                  "2011-01-01T00:00:00.Z", "1:2:3", "23:59:59", "00:60:00", "12:00:59 ",
+                  "10:00:599", "2011-1-111"]
+        for value in values:
+            for format_option, format_string in datetime_formats.items():
+                if format_option == "date-time" and "." in value:
+                    format_string = "%Y-%m-%dT%H:%M:%S.%fZ"
+                try:
+                    datetime.datetime.strptime(value, format_string)
+                except ValueError:
+                    self.assertRaises(ValueError, validictory.validate, value,
+                                      {"format": format_option})
+                else:
+                    validictory.validate(value, {"format": format_option})
+
+    def test_format_datetime_message(self):
+        with self.assertRaises(validictory.FieldValidationError) as cm:
+            validictory.validate("2011-02-29", self.schema_date)
+        self.assertEqual(str(cm.exception),
+                         "Value '2011-02-29' for field '<obj>' is not in 'date' format")
+
+    def test_format_error_path(self):
+        schema = {"properties": {"a": {"properties": {"b": {"items": {"format": "date"}}}}}}
+        data = {"a": {"b": ["2011-02-28", "2011-02-29"]}}
+        for fail_fast in (True, False):
+            with self.assertRaises(validictory.ValidationError) as cm:
+                validictory.validate(data, schema, fail_fast=fail_fast)
+            error = cm.exception if fail_fast else cm.exception.errors[0]
+            self.assertEqual(error.path, "<obj>.a.b[1]")
+            self.assertEqual(error.path_parts, ("a", "b", 1))
+
+    def test_format_error_message(self):
+        schema = {"properties": {"d": {"format": "date"}}}
+        for fail_fast in (True, False):
+            with self.assertRaises(validictory.ValidationError) as cm:
+                validictory.validate({"d": "nope"}, schema, fail_fast=fail_fast)
+            error = cm.exception if fail_fast else cm.exception.errors[0]
+            expected = "Value 'nope' for field '<obj>.d' is not in 'date' format"
+            self.assertEqual(str(pickle.loads(pickle.dumps(error))), expected)
+            self.assertEqual(str(error), expected)
+            self.assertEqual(error.path, "<obj>.d")
+
     def test_format_datetime_bad_type(self):
         data = 3
         self.assertRaises(ValueError, validictory.validate, data,
@@ -209,6 +283,54 @@ class TestFormat(TestCase):
             self.assertRaises(ValueError, validictory.validate, ip,
                               self.schema_ip)
 
+    def test_format_ip_same_as_inet_aton(self):
+        # the dotted-quad fast path agrees with the socket.inet_aton() check
+        for ip in ["0.0.0.0", "255.255.255.255", "010.1.1.1", "1.2.3.04", "0x1.2.3.4",
+                   "1.2.3", "1.2.3.4.", " 1.2.3.4", "1.2.3.4\n", "1.2.3.4\x00"]:
+            try:
+                socket.inet_aton(ip)
+                valid = len(ip.split('.')) == 4
+            except (OSError, ValueError):
+                valid = False
+            if valid:
+                validictory.validate(ip, self.schema_ip)
+            else:
+                self.assertRaises(ValueError, validictory.validate, ip, self.schema_ip)
+
+    def test_format_ipv6_pass(self):
+        for ip in ["::1", "::", "2001:db8::8a2e:370:7334", "fe80::1:2:3:4",
+                   "::ffff:192.0.2.1", "2001:0db8:0000:0000:0000:ff00:0042:8329"]:
+            validictory.validate(ip, self.schema_ipv6)
+
+    def test_format_ipv6_fail(self):
+        for ip in ["1.2.3.4", "2001:db8::8a2e::7334", "12345::", ":::", "g::1", "", 1]:
+            self.assertRaises(ValueError, validictory.validate, ip, self.schema_ipv6)
+
+    def test_format_hostname_pass(self):
+        for hostname in ["localhost", "example.com", "www.example.co.uk", "a-b.c1",
+                         "1.2.3.4", "x" * 63 + ".com"]:
+            validictory.validate(hostname, self.schema_hostname)
+        validictory.validate("example.com", {"format": "host-name"})
+
+    def test_format_hostname_fail(self):
+        for hostname in ["", "-example.com", "example-.com", "exa mple.com", "example..com",
+                         "example.com.", "x" * 64 + ".com", ".".join(["abcdefg"] * 32),
+                         "under_score.com", 12]:
+            self.assertRaises(ValueError, validictory.validate, hostname,
+                              self.schema_hostname)
+
+    def test_format_uri_pass(self):
+        for uri in ["http://json-schema.org/draft-03/schema#", "mailto:joe@example.com",
+                    "urn:isbn:0451450523", "https://example.com/a%20b?q=1&r=[2]",
+                    "file:///tmp/x", "#", "#/properties/a", "other.json#/items",
+                    "/relative/path", "//example.com/x"]:
+            validictory.validate(uri, self.schema_uri)
+
+    def test_format_uri_fail(self):
+        for uri in ["http://exa mple.com", "1http://x", ":x", "a_b:c",
+                    "http://example.com/%zz", "#{}"]:
+            self.assertRaises(ValueError, validictory.validate, uri, self.schema_uri)
+
     def test_format_required_false(self):
         schema = {
             'type': 'object',
@@ -276,6 +398,77 @@ class TestFormat(TestCase):
                           self.schema_non_empty_dict)
 
 
+class TestFormatCache(TestCase):
+
+    def setUp(self):
+        self.calls = []
+
+    def validate_format_spaces(self, validator, fieldname, value, format_option):
+        self.calls.append(value)
+        validate_format_contains_spaces(validator, fieldname, value, format_option)
+
+    def test_format_cache(self):
+        validator = validictory.SchemaValidator(format_cache_size=2)
+        validator.register_format_validator('spaces', self.validate_format_spaces)
+        schema = {"type": "array", "items": {"format": "spaces"}}
+        validator.validate(["a b", "a b", "c d", "a b"], schema)
+        self.assertEqual(self.calls, ["a b", "c d"])
+
+        # least recently used values are evicted
+        validator.validate(["e f", "a b", "c d"], schema)
+        self.assertEqual(self.calls, ["a b", "c d", "e f", "c d"])
+
+    def test_format_cache_failures_not_cached(self):
+        validator = validictory.SchemaValidator(format_cache_size=10, fail_fast=False)
+        validator.register_format_validator('spaces', self.validate_format_spaces)
+        schema = {"properties": {"a": {"format": "spaces"}, "b": {"format": "spaces"}}}
+        with self.assertRaises(validictory.MultipleValidationError) as cm:
+            validator.validate({"a": "x", "b": "x"}, schema)
+        self.assertEqual([e.fieldname for e in cm.exception.errors], ["a", "b"])
+        self.assertEqual(self.calls, ["x", "x"])
+
+    def test_format_cache_value_types(self):
+        def validate_format_int(validator, fieldname, value, format_option):
+            if type(value) is not int:
+                raise validictory.FieldValidationError("is not an int", fieldname, value)
+
+        validator = validictory.SchemaValidator({'int': validate_format_int},
+                                                format_cache_size=10)
+        validator.validate(1, {"format": "int"})
+        self.assertRaises(ValueError, validator.validate, 1.0, {"format": "int"})
+        self.assertRaises(ValueError, validator.validate, True, {"format": "int"})
+        self.assertRaises(ValueError, validator.validate, [1], {"format": "int"})
+
+    def test_format_cache_opt_out(self):
+        validator = validictory.SchemaValidator(format_cache_size=10)
+        validator.register_format_validator('spaces', self.validate_format_spaces,
+                                            cacheable=False)
+        validator.validate(["a b", "a b"], {"items": {"format": "spaces"}})
+        self.assertEqual(self.calls, ["a b", "a b"])
+
+        def validate_format_uncacheable(validator, fieldname, value, format_option):
+            self.calls.append(value)
+        validate_format_uncacheable.cacheable = False
+
+        validator = validictory.SchemaValidator({'spaces': validate_format_uncacheable},
+                                                format_cache_size=10)
+        validator.validate(["c", "c"], {"items": {"format": "spaces"}})
+        self.assertEqual(self.calls, ["a b", "a b", "c", "c"])
+
+    def test_format_cache_cleared_on_register(self):
+        validator = validictory.SchemaValidator(format_cache_size=10)
+        validator.register_format_validator('spaces', self.validate_format_spaces)
+        validator.validate("a b", {"format": "spaces"})
+        validator.register_format_validator('spaces', self.validate_format_spaces)
+        validator.validate("a b", {"format": "spaces"})
+        self.assertEqual(self.calls, ["a b", "a b"])
+
+    def test_format_cache_disabled_by_default(self):
+        validator = validictory.SchemaValidator({'spaces': self.validate_format_spaces})
+        validator.validate(["a b", "a b"], {"items": {"format": "spaces"}})
+        self.assertEqual(self.calls, ["a b", "a b"])
+
+
 class TestUniqueItems(TestCase):
 
     schema = {"uniqueItems": True}
@@ -353,6 +546,32 @@ class TestUniqueItems(TestCase):
 
         self.assertRaises(ValueError, validictory.validate, data, self.schema)
 
+    def test_uniqueitems_booleans_and_numbers(self):
+        for data in ([1, True], [0, False], [[1], [True]], [{"a": 0}, {"a": False}],
+                     [1, "1", True, None, [], {}, [[]], [{}]]):
+            validictory.validate(data, self.schema)
+
+        for data in ([1, 1.0], [True, True], [[1, 2.0], [1.0, 2]], [{"a": [1]}, {"a": [1.0]}]):
+            self.assertRaises(ValueError, validictory.validate, data, self.schema)
+
+    def test_uniqueitems_fail_key_order(self):
+        data = [{"one": 1, "two": [2, {"three": 3}]}, {"two": [2, {"three": 3}], "one": 1}]
+        self.assertRaises(ValueError, validictory.validate, data, self.schema)
+
+    def test_uniqueitems_fail_list_and_tuple(self):
+        data = [[1, 2], (1, 2)]
+        self.assertRaises(ValueError, validictory.validate, data, self.schema)
+
+    def test_uniqueitems_unhashable(self):
+        validictory.validate([{1}, {2}, [{1}]], self.schema)
+        self.assertRaises(ValueError, validictory.validate, [{1}, [1], {1}], self.schema)
+
+    def test_uniqueitems_errors(self):
+        data = [{"a": 1}, 2, {"a": 1}, 2, {"a": 1}]
+        with self.assertRaises(validictory.MultipleValidationError) as cm:
+            validictory.validate(data, self.schema, fail_fast=False)
+        self.assertEqual([e.value for e in cm.exception.errors], [{"a": 1}, 2, {"a": 1}])
+
 
 class TestMaximum(TestCase):
     props = {
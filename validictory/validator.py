@@ -1,30 +1,167 @@
+import asyncio
+import contextvars
 import copy
+import functools
+import ipaddress
+import itertools
 import re
 import socket
+import threading
+from collections import OrderedDict
 from collections.abc import Container, Mapping
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, time
 from decimal import Decimal
+from time import perf_counter
+from urllib.parse import unquote, urldefrag, urljoin
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
 
 
 class SchemaError(ValueError):
     """ errors encountered in processing a schema (subclass of :class:`ValueError`) """
 
 
+class _RefCycleError(SchemaError):
+    '''
+    Raised for references (``$ref``) which lead back to a schema they went through without
+    validating another field, which would recurse forever.  Unlike other schema errors, it
+    isn't taken for a mismatch of one of the types of a union.
+    '''
+
+
 class ValidationError(ValueError):
     """ validation errors encountered during validation (subclass of :class:`ValueError`) """
 
+    # errors raised by the validator are created with a _LazyMessage, which is replaced by
+    # the formatted message as soon as the message or args are used
+    @property
+    def args(self):
+        args = super().args
+        if args and isinstance(args[0], _LazyMessage):
+            args = (str(args[0]),) + args[1:]
+            BaseException.args.__set__(self, args)
+        return args
+
+    @args.setter
+    def args(self, args):
+        BaseException.args.__set__(self, args)
+
+    def __str__(self):
+        self.args
+        return super().__str__()
+
+    def __repr__(self):
+        self.args
+        return super().__repr__()
+
+    def __reduce__(self):
+        # subclasses take different __init__ arguments, so restore them without calling it
+        return _restore_error, (type(self), self.args), self.__dict__
+
+
+def _restore_error(cls, args):
+    return cls.__new__(cls, *args)
+
+
+class _LazyMessage:
+    '''
+    Message of an error, only built by calling ``function(*args, **kwargs)`` when it is
+    first used, see :class:`ValidationError`.  Most errors of large documents are never
+    displayed.
+    '''
+    __slots__ = ('function', 'args', 'kwargs', 'text')
+
+    def __init__(self, function, *args, **kwargs):
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.text = None
+
+    def __str__(self):
+        if self.text is None:
+            self.text = self.function(*self.args, **self.kwargs)
+            self.function = self.args = self.kwargs = None
+        return self.text
+
+
+def _snapshot(value):
+    # the data may still change before the message is formatted, by apply_default_to_data
+    # for instance, so the value is copied (the containers it holds are not)
+    return value.copy() if type(value) in (dict, list) else value
+
+
+class _ErrorLimitReached(Exception):
+    '''
+    Raised by :meth:`SchemaValidator._add_error` to stop validating once ``max_errors`` errors
+    were found, not a :class:`ValueError` so that nothing on the way mistakes it for one.
+    '''
+
+
+# Paths to fields are built as (parent path, property name or list index) tuples, which is
+# cheaper than string concatenation, and are only rendered when an error is reported.  The
+# path of the validated data itself is a string.
+
+def _path_parts(path):
+    parts = []
+    while isinstance(path, tuple):
+        path, part = path
+        parts.append(part)
+    return tuple(reversed(parts))
+
+
+def _render_path(path):
+    root = path
+    while isinstance(root, tuple):
+        root = root[0]
+    return str(root) + ''.join(f'[{part}]' if isinstance(part, int) else f'.{part}'
+                               for part in _path_parts(path))
+
+
+def _stats_path(path):
+    # list indices are left out so that the items of a list are counted together
+    root = path
+    while isinstance(root, tuple):
+        root = root[0]
+    return str(root) + ''.join('[]' if isinstance(part, int) else f'.{part}'
+                               for part in _path_parts(path))
+
 
 class FieldValidationError(ValidationError):
     """
-    Validation error that refers to a specific field and has `fieldname` and `value` attributes.
+    Validation error that refers to a specific field and has `fieldname`, `value`, `path`
+    and `path_parts` attributes.  `path_parts` is a tuple of the property names and list
+    indices leading to the field.
     """
 
     def __init__(self, message, fieldname, value, path=''):
-        message = f"Value {value!r} for field '{path}' {message}"
-        super().__init__(message)
+        # the path is read when the message is built, as it may be set after the error was
+        # created (see SchemaValidator.validate_format)
+        super().__init__(_LazyMessage(self._describe, message, _snapshot(value)))
         self.fieldname = fieldname
         self.value = value
-        self.path = path
+        self._path = path
+
+    def __getattr__(self, name):
+        # like the message, the path is only rendered when it is used
+        if name == 'path':
+            self.path = _render_path(self.__dict__.get('_path', ''))
+            return self.path
+        if name == 'path_parts':
+            self.path_parts = _path_parts(self.__dict__.get('_path', ''))
+            return self.path_parts
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def _describe(self, message, value):
+        return f"Value {value!r} for field '{self.path}' {message}"
+
+    def __reduce__(self):
+        # the path is sent rendered, its nested tuples could be too deep to be pickled
+        state = dict(self.__dict__, _path=self.path, path=self.path, path_parts=self.path_parts)
+        return _restore_error, (type(self), self.args), state
 
 
 class DependencyValidationError(ValidationError):
@@ -45,40 +182,48 @@ class RequiredFieldValidationError(ValidationError):
         super().__init__(message)
 
 
+def _describe_errors(errors):
+    return "{} validation errors:\n{}".format(len(errors), '\n'.join(str(e) for e in errors))
+
+
 class MultipleValidationError(ValidationError):
     def __init__(self, errors):
-        msg = "{} validation errors:\n{}".format(len(errors), '\n'.join(str(e) for e in errors))
-        super().__init__(msg)
+        super().__init__(_LazyMessage(_describe_errors, errors))
         self.errors = errors
 
 
-def _generate_datetime_validator(format_option, dateformat_string):
+# The fields accept exactly what datetime.strptime accepts for the %Y, %m, %d, %H, %M, %S and
+# %f directives, with matching also being case insensitive, so that results are unchanged.
+_DATE_PATTERN = r'(\d\d\d\d)-(1[0-2]|0[1-9]|[1-9])-(3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])'
+_TIME_PATTERN = r'(2[0-3]|[0-1]\d|\d):([0-5]\d|\d):(6[0-1]|[0-5]\d|\d)'
+
+
+def _generate_datetime_validator(format_option, pattern, constructor):
+    # Matching a precompiled regular expression and letting the date/time constructor check the
+    # bounds (days in month, leap years, leap seconds) is much faster than datetime.strptime
+    regex = re.compile(pattern, re.IGNORECASE)
+
     def validate_format_datetime(validator, fieldname, value, format_option):
+        match = regex.fullmatch(value) if isinstance(value, str) else None
         try:
-            # Additions to support date-time with microseconds without breaking
-            # existing date-time validation.
-            # Microseconds will appear specifically separated by a period, as
-            # some variable length decimal number
-            # such as  '2015-11-18T19:57:05.061Z' instead of
-            # '2015-11-18T19:57:05Z'  Better would be to use
-            # strict_rfc3339 vs datetime.strptime though the user needs the
-            #  package installed for the import to succeed.
-            #     import strict_rfc3339
-            #     assert strict_rfc3339.validate_rfc3339(value)
-            if format_option == 'date-time' and '.' in value:
-                datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%fZ')
-            else:
-                datetime.strptime(value, dateformat_string)
-        except (TypeError, ValueError):
+            if match is None:
+                raise ValueError(value)
+            constructor(*map(int, match.groups()))
+        except ValueError:
             msg = "is not in '{format_option}' format"
             raise FieldValidationError(msg.format(format_option=format_option), fieldname, value)
 
+    # named after the module level function it is assigned to, so that it can be pickled
+    name = 'validate_format_' + format_option.replace('-', '_')
+    validate_format_datetime.__name__ = validate_format_datetime.__qualname__ = name
     return validate_format_datetime
 
 
-validate_format_date_time = _generate_datetime_validator('date-time', '%Y-%m-%dT%H:%M:%SZ')
-validate_format_date = _generate_datetime_validator('date', '%Y-%m-%d')
-validate_format_time = _generate_datetime_validator('time', '%H:%M:%S')
+# microseconds are optional, such as '2015-11-18T19:57:05.061Z' or '2015-11-18T19:57:05Z'
+validate_format_date_time = _generate_datetime_validator(
+    'date-time', _DATE_PATTERN + 'T' + _TIME_PATTERN + r'(?:\.[0-9]{1,6})?Z', datetime)
+validate_format_date = _generate_datetime_validator('date', _DATE_PATTERN, date)
+validate_format_time = _generate_datetime_validator('time', _TIME_PATTERN, time)
 
 
 def validate_format_utc_millisec(validator, fieldname, value, format_option):
@@ -87,32 +232,395 @@ def validate_format_utc_millisec(validator, fieldname, value, format_option):
         raise FieldValidationError(msg, fieldname, value)
 
 
-def validate_format_ip_address(validator, fieldname, value, format_option):
+_OCTET_PATTERN = r'(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])'
+_DOTTED_QUAD = re.compile(r'{0}\.{0}\.{0}\.{0}'.format(_OCTET_PATTERN))
+_HOSTNAME = re.compile(r'(?=.{1,253}$)(?!-)[A-Za-z0-9-]{1,63}(?<!-)'
+                       r'(?:\.(?!-)[A-Za-z0-9-]{1,63}(?<!-))*')
+# URI references: a scheme is optional, but a colon before the path must end a valid one
+_URI = re.compile(r"(?:[A-Za-z][A-Za-z0-9+.-]*:|(?![^/?#]*:))"
+                  r"(?:[A-Za-z0-9._~:/?#\[\]@!$&'()*+,;=-]|%[0-9A-Fa-f]{2})*")
+
+
+# the results of the slower checks are memoized, as the same values tend to come up again
+@functools.lru_cache(maxsize=4096)
+def _is_ip_address(value):
     try:
         # Make sure we expect "X.X.X.X" as socket.inet_aton() converts "1" to "0.0.0.1"
         socket.inet_aton(value)
-        ip = len(value.split('.')) == 4
-    except (OSError, TypeError):
-        ip = False
-    if not ip:
+        return len(value.split('.')) == 4
+    except (OSError, ValueError):
+        return False
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_ipv6(value):
+    try:
+        ipaddress.IPv6Address(value)
+        return True
+    except ValueError:
+        return False
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_hostname(value):
+    return _HOSTNAME.fullmatch(value) is not None
+
+
+def validate_format_ip_address(validator, fieldname, value, format_option):
+    # plain dotted quads don't need the system's parser
+    if not isinstance(value, str) or (not _DOTTED_QUAD.fullmatch(value) and
+                                      not _is_ip_address(value)):
         msg = "is not a ip-address"
         raise FieldValidationError(msg, fieldname, value)
 
 
+def validate_format_ipv6(validator, fieldname, value, format_option):
+    if not isinstance(value, str) or not _is_ipv6(value):
+        msg = "is not an ipv6 address"
+        raise FieldValidationError(msg, fieldname, value)
+
+
+def validate_format_hostname(validator, fieldname, value, format_option):
+    if not isinstance(value, str) or not _is_hostname(value):
+        msg = "is not a hostname"
+        raise FieldValidationError(msg, fieldname, value)
+
+
+def validate_format_uri(validator, fieldname, value, format_option):
+    if not isinstance(value, str) or not _URI.fullmatch(value):
+        msg = "is not a uri"
+        raise FieldValidationError(msg, fieldname, value)
+
+
+# errors collected by the SchemaValidator.validate call running in the current thread or task
+_call_errors = contextvars.ContextVar('validictory_errors')
+# schema passed to that call, which local references ("#/...") are resolved against
+_call_root = contextvars.ContextVar('validictory_root')
+# the container and name of the field whose references are being followed, the schema the
+# last one led to and the same tuple for the previous one of that field, or None
+_call_refs = contextvars.ContextVar('validictory_refs')
+
+# patterns that can't be safely wrapped into an alternation with other patterns: global inline
+# flags, group references by number or name, and conditionals
+_UNCOMBINABLE_PATTERN = re.compile(r'\(\?[aiLmsux]+\)|\\[1-9]|\(\?P=|\(\?\(')
+
+
+class _LRUCache:
+    '''
+    Thread-safe set of keys bounded to the ``maxsize`` most recently used ones.
+    '''
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._keys = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self._lock:
+            try:
+                self._keys.move_to_end(key)
+            except KeyError:
+                self.misses += 1
+                return False
+            self.hits += 1
+            return True
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, key):
+        with self._lock:
+            self._keys[key] = None
+            if len(self._keys) > self.maxsize:
+                self._keys.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._keys.clear()
+
+
 DEFAULT_FORMAT_VALIDATORS = {
     'date-time': validate_format_date_time,
     'date': validate_format_date,
     'time': validate_format_time,
     'utc-millisec': validate_format_utc_millisec,
     'ip-address': validate_format_ip_address,
+    'ipv6': validate_format_ipv6,
+    'hostname': validate_format_hostname,
+    'host-name': validate_format_hostname,
+    'uri': validate_format_uri,
 }
 
 
+def _subschemas(schema):
+    ''' Yields the sub-schemas that validation of ``schema`` may recurse into '''
+    for key in ('properties', 'patternProperties'):
+        if isinstance(schema.get(key), dict):
+            yield from schema[key].values()
+    for key in ('items', 'type', 'disallow'):
+        value = schema.get(key)
+        if isinstance(value, dict):
+            yield value
+        elif isinstance(value, (list, tuple)):
+            yield from value
+    for key in ('additionalProperties', 'additionalItems'):
+        if isinstance(schema.get(key), dict):
+            yield schema[key]
+
+
+def _fingerprint(schema):
+    '''
+    Returns a hashable value which is equal for schemas of the same structure.  Keys keep
+    their order, as the order of the errors depends on it, and leaves are tagged with their
+    type so that 1, 1.0 and True aren't mixed up.  The value is only hashable if the leaves
+    of the schema are.
+    '''
+    parts = []
+    append = parts.append
+
+    # containers are written as their type and length followed by their contents
+    def walk(value):
+        if isinstance(value, dict):
+            append(dict)
+            append(len(value))
+            for key, item in value.items():
+                if type(key) is not str:
+                    append(type(key))
+                append(key)
+                walk(item)
+        elif isinstance(value, (list, tuple)):
+            append(type(value))
+            append(len(value))
+            for item in value:
+                walk(item)
+        else:
+            append(type(value))
+            append(value)
+
+    walk(schema)
+    return tuple(parts)
+
+
+# tags of the canonical forms of booleans, arrays and objects
+_BOOLEAN, _ARRAY, _OBJECT = object(), object(), object()
+# values which are their own canonical form
+_SCALAR_TYPES = frozenset((str, int, float, type(None)))
+
+
+def _canonical(value):
+    '''
+    Returns a hashable form of a json value which is equal for equal values: lists and
+    tuples are both arrays, objects don't depend on the order of their keys, and booleans
+    aren't equal to the numbers 0 and 1 (while 1 and 1.0 are equal).  Raises TypeError
+    for other unhashable values.
+    '''
+    if type(value) is bool:
+        return _BOOLEAN, value
+    if isinstance(value, (list, tuple)):
+        return _ARRAY, tuple(map(_canonical, value))
+    if isinstance(value, dict):
+        return _OBJECT, frozenset((key, _canonical(item)) for key, item in value.items())
+    hash(value)
+    return value
+
+
+def _prepare_enum(options):
+    ''' Returns ``options`` with the set of its hashable options and the list of the others '''
+    hashables = set()
+    unhashables = []
+    for option in options:
+        try:
+            hashables.add(option)
+        except TypeError:
+            unhashables.append(option)
+    return options, frozenset(hashables), unhashables
+
+
+def _column_lists(columns):
+    '''
+    Returns a dictionary of lists from a mapping of column names to sequences (such as
+    numpy arrays), a pandas DataFrame or a pyarrow Table.
+    '''
+    if hasattr(columns, 'to_pydict'):
+        columns = columns.to_pydict()
+    elif hasattr(columns, 'to_dict') and hasattr(columns, 'columns'):
+        columns = columns.to_dict('list')
+    lists = {}
+    for name, column in columns.items():
+        if hasattr(column, 'tolist'):
+            column = column.tolist()
+        elif not isinstance(column, (list, tuple)):
+            column = list(column)
+        lists[name] = column
+    return lists
+
+
+def _resolve_pointer(document, pointer):
+    ''' Returns the part of ``document`` designated by a JSON pointer such as "/items/0" '''
+    for token in pointer.split('/')[1:]:
+        token = unquote(token).replace('~1', '/').replace('~0', '~')
+        if isinstance(document, (list, tuple)):
+            token = int(token)
+        document = document[token]
+    return document
+
+
+# keywords of item schemas which can be checked on a whole list of numbers at once with numpy,
+# for lists of at least _VECTORIZE_MIN_ITEMS items
+_VECTORIZABLE_KEYWORDS = frozenset(('type', 'minimum', 'maximum', 'exclusiveMinimum',
+                                    'exclusiveMaximum', 'divisibleBy', 'required', 'blank',
+                                    'title', 'description'))
+_VECTORIZE_MIN_ITEMS = 64
+# floats can't represent every integer beyond this
+_MAX_EXACT_FLOAT = 2 ** 53
+
+# keywords of the schemas of records and of their fields which validate_columns can check on
+# whole columns, rows of other schemas are all validated one by one
+_TABLE_KEYWORDS = frozenset(('type', 'properties', 'additionalProperties', 'required', 'blank',
+                             'title', 'description'))
+_COLUMN_KEYWORDS = frozenset(('type', 'enum', 'pattern', 'minLength', 'maxLength', 'minimum',
+                              'maximum', 'exclusiveMinimum', 'exclusiveMaximum', 'divisibleBy',
+                              'required', 'blank', 'title', 'description'))
+
+# methods named like validators of keywords which aren't ones
+_NOT_KEYWORDS = frozenset(('validate_many', 'validate_async', 'validate_many_async',
+                           'validate_columns'))
+
+
+@functools.lru_cache(maxsize=128)
+def _dispatch_names(cls):
+    '''
+    Returns the names of the methods of a validator class validating each keyword and
+    checking each type.
+    '''
+    keywords = {}
+    types = {}
+    for name in dir(cls):
+        if name.startswith('validate_type_'):
+            types[name[len('validate_type_'):]] = name
+        elif name.startswith('validate_') and name not in _NOT_KEYWORDS:
+            keywords[name[len('validate_'):]] = name
+    return keywords, types
+
+
+class ValidationStats:
+    '''
+    Counts the calls and accumulates the time spent per keyword and per path, when passed
+    as the ``stats`` option of a :class:`SchemaValidator`.
+
+    ``keywords`` and ``paths`` map each keyword or path to a ``[calls, seconds]`` list.
+    The time of keywords validating nested fields, such as ``properties`` or ``items``,
+    includes the time spent on those fields.
+
+    Any object with a :meth:`record` method can be used as the ``stats`` option instead,
+    for example to feed a metrics system.
+    '''
+
+    def __init__(self):
+        self.keywords = {}
+        self.paths = {}
+        self._lock = threading.Lock()
+
+    def record(self, keyword, path, elapsed):
+        '''
+        Called after each keyword is validated.
+
+        :param keyword: the keyword, such as ``"pattern"``, or ``"format:<name>"`` for the
+            call to a format validator
+        :param path: the path to the field, such as ``"<obj>.items[].name"``, list indices
+            being left out
+        :param elapsed: the time spent, in seconds
+        '''
+        with self._lock:
+            for totals, key in ((self.keywords, keyword), (self.paths, path)):
+                total = totals.get(key)
+                if total is None:
+                    totals[key] = [1, elapsed]
+                else:
+                    total[0] += 1
+                    total[1] += elapsed
+
+    def clear(self):
+        ''' Forgets the calls recorded so far '''
+        with self._lock:
+            self.keywords.clear()
+            self.paths.clear()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class CompiledSchema:
+    '''
+    A schema prepared for repeated validation by :meth:`SchemaValidator.compile`.
+
+    :param validator: the :class:`SchemaValidator` that compiled the schema
+    :param schema: the compiled schema
+    '''
+
+    def __init__(self, validator, schema):
+        self.validator = validator
+        self.schema = schema
+
+    def validate(self, data):
+        '''
+        Validates a piece of json data against the compiled schema.
+        '''
+        return self.validator.validate(data, self.schema)
+
+    def validate_many(self, documents, workers=None, chunksize=256):
+        '''
+        Validates each piece of json data in an iterable against the compiled schema, see
+        :meth:`SchemaValidator.validate_many`.
+        '''
+        return self.validator.validate_many(documents, self.schema, workers, chunksize)
+
+    def validate_columns(self, columns):
+        '''
+        Validates a batch of records stored by columns against the compiled schema, see
+        :meth:`SchemaValidator.validate_columns`.
+        '''
+        return self.validator.validate_columns(columns, self.schema)
+
+    async def validate_async(self, data, executor=None):
+        '''
+        Coroutine version of :meth:`validate`, see :meth:`SchemaValidator.validate_async`.
+        '''
+        await self.validator.validate_async(data, self.schema, executor)
+
+    def validate_many_async(self, documents, chunksize=256, executor=None):
+        '''
+        Asynchronous generator version of :meth:`validate_many`, see
+        :meth:`SchemaValidator.validate_many_async`.
+        '''
+        return self.validator.validate_many_async(documents, self.schema, chunksize, executor)
+
+
 class SchemaValidator:
     '''
     Validator largely based upon the JSON Schema proposal but useful for
     validating arbitrary python data structures.
 
+    A validator keeps no state between calls to :meth:`validate`, so one
+    instance can be reused for many documents and shared between threads.
+
+    The ``validate_<keyword>(x, fieldname, schema, path, value)`` methods validate
+    each keyword, and the ``validate_type_<name>(value)`` methods check each type.
+    They are looked up once, when the validator is created, into two dictionaries
+    which can also be changed to support other keywords and types without
+    subclassing (before compiling any schema):
+
+    * ``keywords`` maps each keyword to the function validating it
+    * ``type_checkers`` maps each type name to a function telling if a value is of
+      that type
+
     :param format_validators: optional dictionary of custom format validators
     :param required_by_default: defaults to True, set to False to make
         ``required`` schema attribute False by default.
@@ -127,15 +635,33 @@ class SchemaValidator:
     :param remove_unknown_properties: defaults to False, set to True to
         filter out properties not listed in the schema definition. Only applies
         when disallow_unknown_properties is False.
+    :param regex_cache_size: defaults to 128, the number of compiled regular
+        expressions (from ``pattern`` and ``patternProperties``) kept by the
+        validator, least recently used ones are evicted first. Set to None
+        for an unbounded cache.
+    :param format_cache_size: defaults to 0, set to a positive number to
+        remember that many ``(format, value)`` pairs which passed their format
+        validator, so that repeated values aren't checked again.  Format
+        validators can opt out, see :meth:`register_format_validator`.
+    :param stats: optional :class:`ValidationStats` (or object with the same
+        ``record`` method) recording the time spent on each keyword.  Validation
+        is slower while it is set, and calls made in the worker processes of
+        :meth:`validate_many` aren't recorded.
+    :param max_errors: optional number of errors after which validation stops
+        when ``fail_fast`` is False, the :class:`MultipleValidationError` then
+        only has the errors found so far.
     '''
 
     def __init__(self, format_validators=None, required_by_default=True,
                  blank_by_default=False, disallow_unknown_properties=False,
                  apply_default_to_data=False, fail_fast=True,
-                 remove_unknown_properties=False):
+                 remove_unknown_properties=False, regex_cache_size=128,
+                 format_cache_size=0, stats=None, max_errors=None):
 
         self._format_validators = {}
-        self._errors = []
+        self._cacheable_formats = set()
+        self._schemas = {}
+        self.format_cache_size = format_cache_size
 
         # add the default format validators
         for key, value in DEFAULT_FORMAT_VALIDATORS.items():
@@ -150,12 +676,208 @@ class SchemaValidator:
         self.disallow_unknown_properties = disallow_unknown_properties
         self.apply_default_to_data = apply_default_to_data
         self.fail_fast = fail_fast
+        self.max_errors = max_errors
 
         # disallow_unknown_properties takes precedence over remove_unknown_properties
         self.remove_unknown_properties = remove_unknown_properties
 
-    def register_format_validator(self, format_name, format_validator_fun):
+        self.regex_cache_size = regex_cache_size
+        self.stats = stats
+
+        keywords, types = _dispatch_names(type(self))
+        self.keywords = {keyword: getattr(self, name) for keyword, name in keywords.items()}
+        self.type_checkers = {fieldtype: getattr(self, name) for fieldtype, name in types.items()}
+        self._reset_caches()
+
+    @property
+    def _errors(self):
+        ''' Errors found so far by the current call to :meth:`validate` '''
+        return _call_errors.get([])
+
+    @_errors.setter
+    def _errors(self, errors):
+        # the errors used to be an attribute reset with "self._errors = []", as subclasses
+        # may still do, while each call now starts with its own list
+        pass
+
+    def _reset_caches(self):
+        self._plans = {}
+        self._enums = {}
+        self._compile_regex = functools.lru_cache(maxsize=self.regex_cache_size)(re.compile)
+        self._format_cache = _LRUCache(self.format_cache_size) if self.format_cache_size else None
+        self._pattern_matcher = functools.lru_cache(maxsize=self.regex_cache_size)(
+            self._combine_patterns)
+
+    def __getstate__(self):
+        # caches refer to schemas by id and hold bound methods, so they are rebuilt instead
+        state = self.__dict__.copy()
+        for name in ('_plans', '_enums', '_compile_regex', '_pattern_matcher', '_format_cache'):
+            del state[name]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._reset_caches()
+
+    def register_format_validator(self, format_name, format_validator_fun, cacheable=None):
+        '''
+        Registers ``format_validator_fun`` as the validator of the ``format_name`` format.
+
+        When the validator has a ``format_cache_size``, values which passed the
+        format validator are remembered and not checked again.  Set
+        ``cacheable`` to False for format validators whose result doesn't only
+        depend on the value, if None the ``cacheable`` attribute of the function
+        is used and defaults to True.
+        '''
+        if cacheable is None:
+            cacheable = getattr(format_validator_fun, 'cacheable', True)
         self._format_validators[format_name] = format_validator_fun
+        if cacheable:
+            self._cacheable_formats.add(format_name)
+        else:
+            self._cacheable_formats.discard(format_name)
+        # values accepted by a previous validator of this format may not pass the new one
+        if getattr(self, '_format_cache', None) is not None:
+            self._format_cache.clear()
+
+    def register_schema(self, schema, uri=None):
+        '''
+        Makes ``schema`` available to references (``$ref``) from other schemas.
+
+        :param uri: the URI of the schema, defaults to its ``id``.  Sub-schemas
+            with an ``id`` of their own are registered as well.
+        '''
+        if uri is None:
+            uri = schema.get('id') if isinstance(schema, dict) else None
+            if not isinstance(uri, str):
+                raise SchemaError("Schema without an 'id' can't be registered without a uri")
+
+        pending = [(urldefrag(uri)[0], schema)]
+        while pending:
+            base, subschema = pending.pop()
+            if isinstance(subschema, dict):
+                if isinstance(subschema.get('id'), str):
+                    base = urldefrag(urljoin(base, subschema['id']))[0]
+                    self._schemas.setdefault(base, subschema)
+                subschemas = subschema.values()
+            elif isinstance(subschema, (list, tuple)):
+                subschemas = subschema
+            else:
+                continue
+            pending.extend((base, value) for value in subschemas)
+        self._schemas[urldefrag(uri)[0]] = schema
+
+    def _resolve_ref(self, ref, root):
+        '''
+        Returns the schema designated by the ``$ref`` URI ``ref`` and the document
+        containing it: ``root`` or a schema added with :meth:`register_schema`.
+        '''
+        base = root.get('id') if isinstance(root, dict) else None
+        base = urldefrag(base)[0] if isinstance(base, str) else ''
+        if not isinstance(ref, str):
+            raise SchemaError(f"Reference {ref!r} is not a string")
+        url, fragment = urldefrag(urljoin(base, ref))
+        if url == base:
+            document = root
+        elif url in self._schemas:
+            document = self._schemas[url]
+        else:
+            raise SchemaError(f"Reference '{ref}' can't be resolved")
+        try:
+            return _resolve_pointer(document, fragment), document
+        except (LookupError, TypeError, ValueError):
+            raise SchemaError(f"Reference '{ref}' can't be resolved") from None
+
+    def compile(self, schema, codegen=False):
+        '''
+        Prepares a schema for repeated validation and returns a :class:`CompiledSchema`.
+
+        The validator method for each keyword of each sub-schema is looked up, and the
+        ``required`` and ``blank`` defaults and the references (``$ref``) are resolved,
+        once instead of on every call.  Neither the schema nor the options of the
+        validator may be changed afterwards.
+
+        :param codegen: defaults to False, set to True to additionally generate a
+            specialized Python function for each sub-schema (see :mod:`validictory.codegen`)
+        '''
+        if codegen:
+            from validictory.codegen import generate_function
+
+        pending = [(schema, schema)]
+        while pending:
+            subschema, root = pending.pop()
+            # invalid sub-schemas are left to be reported during validation
+            if not isinstance(subschema, dict):
+                continue
+            plan = self._plans.get(id(subschema))
+            if plan is not None and plan[0] is subschema and (plan[2] or not codegen):
+                continue
+            steps = self._plan(subschema, root)
+            function = generate_function(self, subschema, steps) if codegen else None
+            self._plans[id(subschema)] = (subschema, steps, function)
+            if isinstance(subschema.get('enum'), (list, tuple)):
+                self._enums[id(subschema['enum'])] = _prepare_enum(subschema['enum'])
+            if steps and steps[0][1] == self._validate_resolved_ref:
+                target, document = steps[0][2]
+                document = root if document is None else document
+                self._check_ref_chain(subschema, target, document)
+                pending.append((target, document))
+            else:
+                pending.extend((child, root) for child in _subschemas(subschema))
+        return CompiledSchema(self, schema)
+
+    def _check_ref_chain(self, schema, target, document):
+        ''' Raises a SchemaError if the references from ``schema`` lead back to one of them '''
+        chain = {id(schema)}
+        while isinstance(target, dict) and '$ref' in target:
+            if id(target) in chain:
+                raise _RefCycleError(f"Reference '{schema['$ref']}' leads back to a schema it "
+                                     "went through")
+            chain.add(id(target))
+            try:
+                target, document = self._resolve_ref(target['$ref'], document)
+            except SchemaError:
+                # left to be reported during validation
+                return
+
+    def _plan(self, schema, root):
+        '''
+        Returns the (keyword, validator, value) triples to call for every keyword of the schema
+        '''
+        if '$ref' in schema:
+            # the referenced schema replaces this one, unknown ones are looked up when used
+            try:
+                target, document = self._resolve_ref(schema['$ref'], root)
+            except SchemaError:
+                return (('$ref', self._validate_ref, schema['$ref']),)
+            if document is root:
+                document = None
+            return (('$ref', self._validate_resolved_ref, (target, document)),)
+
+        steps = []
+        for schemaprop, value in schema.items():
+            validator = self.keywords.get(schemaprop)
+            if validator:
+                steps.append((schemaprop, validator, value))
+        if self.required_by_default and 'required' not in schema:
+            steps.append(('required', self.keywords['required'], self.required_by_default))
+        if not self.blank_by_default and 'blank' not in schema:
+            steps.append(('blank', self.keywords['blank'], self.blank_by_default))
+        return tuple(steps)
+
+    def _combine_patterns(self, patterns):
+        '''
+        Returns a function telling if a string matches any of the regular expressions in
+        ``patterns``, combined into a single alternation when that is safe.
+        '''
+        if len(patterns) > 1 and all(isinstance(p, str) and not _UNCOMBINABLE_PATTERN.search(p)
+                                     for p in patterns):
+            try:
+                return self._compile_regex('|'.join(f'(?:{p})' for p in patterns)).match
+            except re.error:
+                pass
+        regexes = [self._compile_regex(p) for p in patterns]
+        return lambda string: any(regex.match(string) for regex in regexes)
 
     def get_default(self, value):
         if isinstance(value, dict) or isinstance(value, list):
@@ -187,21 +909,30 @@ class SchemaValidator:
         return True
 
     def _error(self, desc, value, fieldname, exctype=FieldValidationError, path='', **params):
-        params['value'] = value
+        params['value'] = _snapshot(value)
         params['fieldname'] = fieldname
-        message = desc.format(**params)
+        message = _LazyMessage(desc.format, **params)
 
         if exctype == FieldValidationError:
             err = FieldValidationError(message, fieldname, value, path)
         elif exctype == DependencyValidationError or exctype == RequiredFieldValidationError:
             err = exctype(message)
             err.fieldname = fieldname
-            err.path = path
+            err.path = _render_path(path)
+            err.path_parts = _path_parts(path)
+        self._add_error(err)
 
+    def _add_error(self, err):
+        '''
+        Raises the error when failing fast, or else adds it to the errors of the current call
+        and stops validating once there are ``max_errors`` of them.
+        '''
         if self.fail_fast:
             raise err
-        else:
-            self._errors.append(err)
+        errors = self._errors
+        errors.append(err)
+        if self.max_errors is not None and len(errors) >= self.max_errors:
+            raise _ErrorLimitReached()
 
     def _validate_unknown_properties(self, schema, data, fieldname, patternProperties):
         """Raise a SchemaError when unknown fields are found."""
@@ -214,10 +945,9 @@ class SchemaValidator:
                 fieldname=fieldname, unknowns=unknowns))
 
         elif self.remove_unknown_properties:
-            patterns = patternProperties.keys() if patternProperties else []
-
-            if patterns:
-                delta = [f for f in delta if not any(re.match(p, f) for p in patterns)]
+            if patternProperties:
+                matches = self._pattern_matcher(tuple(patternProperties))
+                delta = [f for f in delta if not matches(f)]
 
             for unknown_field in delta:
                 del data[unknown_field]
@@ -235,44 +965,116 @@ class SchemaValidator:
 
         if fieldtype and fieldexists:
             if isinstance(fieldtype, (list, tuple)):
-                # Match if type matches any one of the types in the list
-                datavalid = False
-                errorlist = []
-                for eachtype in fieldtype:
-                    try:
-                        # if fail_fast is False, _error will not rais an exception.
-                        # need to monitor the _errors list as well
-                        errors = self._errors[:]
-                        self.validate_type(x, fieldname, eachtype, path, eachtype)
-                        if len(self._errors) > len(errors):
-                            # an exception was raised.
-                            # remove the error from self.errors and raise it here
-                            raise self._errors.pop()
-
-                        datavalid = True
-                        break
-                    except (SchemaError, ValidationError) as err:
-                        errorlist.append(err)
-                if not datavalid:
-                    self._error("doesn't match any of {numsubtypes} subtypes in {fieldtype}; "
-                                "errorlist = {errorlist!r}",
-                                value, fieldname, path=path, numsubtypes=len(fieldtype),
-                                fieldtype=fieldtype, errorlist=errorlist)
+                self._validate_type_union(x, fieldname, path, value, fieldtype)
             elif isinstance(fieldtype, dict):
                 try:
                     self.__validate(fieldname, x, fieldtype, path)
                 except ValueError as e:
                     raise e
             else:
-                try:
-                    type_checker = getattr(self, 'validate_type_' + fieldtype)
-                except AttributeError:
+                type_checker = self.type_checkers.get(fieldtype)
+                if type_checker is None:
                     raise SchemaError(f"Field type '{fieldtype}' is not supported.")
 
                 if not type_checker(value):
                     self._error("is not of type {fieldtype}", value, fieldname, path=path,
                                 fieldtype=fieldtype)
 
+    def _validate_steps_timed(self, x, fieldname, schema, path, steps):
+        ''' Calls the validators of ``steps``, recording the time spent in each one '''
+        stats_path = _stats_path(path)
+        for keyword, validator, value in steps:
+            start = perf_counter()
+            try:
+                validator(x, fieldname, schema, path, value)
+            finally:
+                self.stats.record(keyword, stats_path, perf_counter() - start)
+
+    def _validate_ref(self, x, fieldname, schema, path, ref):
+        ''' Validates the given field against the schema designated by ``ref`` '''
+        root = _call_root.get(None)
+        target, document = self._resolve_ref(ref, root)
+        self._validate_resolved_ref(x, fieldname, schema, path,
+                                    (target, None if document is root else document))
+
+    def _validate_resolved_ref(self, x, fieldname, schema, path, resolved):
+        target, document = resolved
+        followed = _call_refs.get(None)
+        if followed is not None and followed[0] is x and followed[1] == fieldname:
+            entry = followed
+            while entry is not None:
+                if entry[2] is target:
+                    raise _RefCycleError(f"Reference '{schema['$ref']}' of field '{fieldname}' "
+                                         "leads back to a schema it went through")
+                entry = entry[3]
+        else:
+            followed = None
+        refs_token = _call_refs.set((x, fieldname, target, followed))
+        try:
+            if document is None:
+                self.__validate(fieldname, x, target, path)
+                return
+            # references of the other document are relative to it
+            token = _call_root.set(document)
+            try:
+                self.__validate(fieldname, x, target, path)
+            finally:
+                _call_root.reset(token)
+        finally:
+            _call_refs.reset(refs_token)
+
+    def _validate_type_union(self, x, fieldname, path, value, fieldtype):
+        ''' Validates that the field matches any one of the types in the list '''
+        # type names are cheap to check, so they are tried before schemas.  Schemas may
+        # change the data though, in which case everything is tried in order
+        if self.apply_default_to_data or self.remove_unknown_properties:
+            names = ()
+        else:
+            names = [eachtype for eachtype in fieldtype if isinstance(eachtype, str)]
+            for name in names:
+                type_checker = self.type_checkers.get(name)
+                if type_checker is not None and type_checker(value):
+                    return
+
+        errors = {}
+        for index, eachtype in enumerate(fieldtype):
+            if names and isinstance(eachtype, str):
+                continue
+            # errors of the schema go to a buffer of their own when fail_fast is False
+            token = _call_errors.set([])
+            try:
+                self.validate_type(x, fieldname, eachtype, path, eachtype)
+            except _RefCycleError:
+                raise
+            except (SchemaError, ValidationError) as err:
+                errors[index] = err
+                continue
+            except _ErrorLimitReached:
+                # the errors found so far are enough to tell that the schema doesn't match
+                pass
+            finally:
+                buffered = self._errors
+                _call_errors.reset(token)
+            if not buffered:
+                return
+            errors[index] = (buffered[0] if len(buffered) == 1 else
+                             MultipleValidationError(buffered))
+
+        # nothing matched, the errors of the type names are only built now
+        errorlist = []
+        for index, eachtype in enumerate(fieldtype):
+            if index in errors:
+                errorlist.append(errors[index])
+            elif eachtype in self.type_checkers:
+                errorlist.append(FieldValidationError(f"is not of type {eachtype}", fieldname,
+                                                      value, path))
+            else:
+                errorlist.append(SchemaError(f"Field type '{eachtype}' is not supported."))
+        self._error("doesn't match any of {numsubtypes} subtypes in {fieldtype}; "
+                    "errorlist = {errorlist!r}",
+                    value, fieldname, path=path, numsubtypes=len(fieldtype),
+                    fieldtype=fieldtype, errorlist=errorlist)
+
     def validate_properties(self, x, fieldname, schema, path, properties=None):
         ''' Validates properties of a JSON object by processing the object's schema recursively '''
         value = x.get(fieldname)
@@ -286,7 +1088,7 @@ class SchemaValidator:
 
                     for property in properties:
                         self.__validate(property, value, properties.get(property),
-                                        path + '.' + property)
+                                        (path, property))
                 else:
                     raise SchemaError("Properties definition of field '{}' is not an object"
                                       .format(fieldname))
@@ -303,15 +1105,27 @@ class SchemaValidator:
                         self._error("is not of same length as schema list", value, fieldname,
                                     path=path)
                     else:
+                        # a single container is reused for every item
+                        container = {}
                         for index, item in enumerate(items):
+                            container["_data"] = value[index]
                             try:
-                                self.__validate("_data", {"_data": value[index]}, item,
-                                                f'{path}[{index}]')
+                                self.__validate("_data", container, item, (path, index))
                             except FieldValidationError as e:
                                 raise type(e)("Failed to validate field '%s' list schema: %s" %
                                               (fieldname, e), fieldname, e.value)
                 elif isinstance(items, dict):
-                    for index, item in enumerate(value):
+                    indexed_items = enumerate(value)
+                    if (numpy is not None and len(value) >= _VECTORIZE_MIN_ITEMS and
+                            self.stats is None):
+                        flagged = self._flag_numeric_items(items, value)
+                        if flagged is not None:
+                            # only the items which may be invalid go through the schema
+                            indexed_items = ((index, value[index]) for index in flagged)
+
+                    # a single container is reused for every item
+                    container = {}
+                    for index, item in indexed_items:
                         if ((self.disallow_unknown_properties or
                              self.remove_unknown_properties) and 'properties' in items):
                             self._validate_unknown_properties(items['properties'],
@@ -319,18 +1133,213 @@ class SchemaValidator:
                                                               fieldname,
                                                               schema.get('patternProperties'))
 
-                        self.__validate("[list item]", {"[list item]": item}, items,
-                                        f'{path}[{index}]')
+                        container["[list item]"] = item
+                        self.__validate("[list item]", container, items, (path, index))
                 else:
                     raise SchemaError("Properties definition of field '{}' is "
                                       "not a list or an object".format(fieldname))
 
+    def _default_keywords(self, schema):
+        '''
+        Tells if the keywords of ``schema``, and ``required`` and ``blank``, are validated by
+        the ``validate_*`` methods of SchemaValidator.
+        '''
+        for keyword in itertools.chain(schema, ('required', 'blank')):
+            validator = self.keywords.get(keyword)
+            if (validator is not None and getattr(validator, '__func__', None) is not
+                    getattr(SchemaValidator, 'validate_' + keyword, None)):
+                return False
+        return True
+
+    def _flag_rows(self, columns, rows, schema):
+        '''
+        Returns the set of the indices of the rows of ``columns`` which may be invalid against
+        the schema of records ``schema``, found by checking each column at once, or None if
+        the schema can't be checked by columns.
+        '''
+        if (self.stats is not None or not isinstance(schema, dict) or
+                not _TABLE_KEYWORDS.issuperset(schema) or not self._default_keywords(schema)):
+            return None
+        fieldtype = schema.get('type', 'object')
+        if (fieldtype not in ('object', 'any') or
+                getattr(self.type_checkers.get(fieldtype), '__func__', None) is not
+                getattr(SchemaValidator, 'validate_type_' + fieldtype)):
+            return None
+        properties = schema.get('properties', {})
+        if not isinstance(properties, dict) or not all(
+                isinstance(schema.get(keyword), (str, type(None)))
+                for keyword in ('title', 'description')):
+            return None
+        additional = schema.get('additionalProperties', True)
+        if additional is not True and (additional is not False or
+                                       not properties.keys() >= columns.keys()):
+            return None
+        if self.disallow_unknown_properties and not properties.keys() >= columns.keys():
+            return None
+
+        flagged = set()
+        for name, subschema in properties.items():
+            if not isinstance(subschema, dict):
+                return None
+            if name in columns:
+                indices = self._flag_column(subschema, columns[name])
+                if indices is None:
+                    return None
+                flagged.update(indices)
+            elif subschema.get('required', self.required_by_default):
+                # the other keywords ignore missing fields
+                return set(range(rows))
+        return flagged
+
+    def _flag_column(self, schema, column):
+        '''
+        Returns the indices of the values of ``column`` which may be invalid against
+        ``schema``, or None if the schema can't be checked on a whole column.
+        '''
+        if not _COLUMN_KEYWORDS.issuperset(schema) or not self._default_keywords(schema):
+            return None
+        if numpy is not None and len(column) >= _VECTORIZE_MIN_ITEMS:
+            flagged = self._flag_numeric_items(schema, column)
+            if flagged is not None:
+                return flagged
+
+        # checks telling if a value may be invalid, those of numbers accept what the
+        # validate_* methods may reject
+        checks = []
+        fieldtype = schema.get('type')
+        if fieldtype is not None:
+            if not isinstance(fieldtype, str) or fieldtype not in self.type_checkers:
+                return None
+            type_checker = self.type_checkers[fieldtype]
+            checks.append(lambda value: not type_checker(value))
+        if 'enum' in schema:
+            options = schema['enum']
+            if not isinstance(options, (list, tuple, set, frozenset)):
+                return None
+            hashables = _prepare_enum(options)[1]
+
+            def check_enum(value):
+                try:
+                    return value is not None and value not in hashables
+                except TypeError:
+                    return True
+            checks.append(check_enum)
+        if 'pattern' in schema:
+            if not isinstance(schema['pattern'], str):
+                return None
+            try:
+                match = self._compile_regex(schema['pattern']).match
+            except re.error:
+                return None
+            checks.append(lambda value: isinstance(value, str) and not match(value))
+        for keyword in ('minLength', 'maxLength', 'minimum', 'maximum', 'divisibleBy'):
+            if keyword in schema and type(schema[keyword]) not in (int, float):
+                return None
+        if 'minLength' in schema:
+            min_length = schema['minLength']
+            checks.append(lambda value: isinstance(value, (str, list, tuple)) and
+                          len(value) < min_length)
+        if 'maxLength' in schema:
+            max_length = schema['maxLength']
+            checks.append(lambda value: isinstance(value, (str, list, tuple)) and
+                          len(value) > max_length)
+        if 'minimum' in schema:
+            minimum = schema['minimum']
+            if schema.get('exclusiveMinimum', False):
+                checks.append(lambda value: value is not None and (
+                    type(value) not in (int, float) or value <= minimum))
+            else:
+                checks.append(lambda value: value is not None and (
+                    type(value) not in (int, float) or value < minimum))
+        if 'maximum' in schema:
+            maximum = schema['maximum']
+            if schema.get('exclusiveMaximum', False):
+                checks.append(lambda value: value is not None and (
+                    type(value) not in (int, float) or value >= maximum))
+            else:
+                checks.append(lambda value: value is not None and (
+                    type(value) not in (int, float) or value > maximum))
+        if 'divisibleBy' in schema:
+            divisor = schema['divisibleBy']
+            if divisor == 0:
+                return None
+            checks.append(lambda value: value is not None and (
+                type(value) not in (int, float) or value % divisor != 0))
+        if not schema.get('blank', self.blank_by_default):
+            checks.append(lambda value: isinstance(value, str) and not value)
+        if not all(isinstance(schema.get(keyword), (str, type(None)))
+                   for keyword in ('title', 'description')):
+            return None
+
+        flagged = set()
+        for check in checks:
+            flagged.update(index for index, value in enumerate(column) if check(value))
+        return flagged
+
+    def _flag_numeric_items(self, items, value):
+        '''
+        Returns the indices of the items of the list ``value`` which may be invalid against
+        ``items``, found with numpy for the whole list at once, or None if ``items`` isn't a
+        schema of numbers that numpy can check exactly like the ``validate_*`` methods.
+        '''
+        if not _VECTORIZABLE_KEYWORDS.issuperset(items):
+            return None
+        fieldtype = items.get('type', 'number')
+        if fieldtype == 'integer':
+            allowed_types = {int}
+        elif fieldtype == 'number':
+            allowed_types = {int, float}
+        else:
+            return None
+
+        # overridden or replaced validators are called on every item
+        if not self._default_keywords(items):
+            return None
+        type_checker = self.type_checkers.get(fieldtype)
+        if getattr(type_checker, '__func__', None) is not getattr(SchemaValidator,
+                                                                  'validate_type_' + fieldtype):
+            return None
+        # invalid schemas are left to be reported by the validate_* methods
+        for keyword in ('minimum', 'maximum', 'divisibleBy'):
+            if keyword in items and not (type(items[keyword]) in (int, float) and
+                                         abs(items[keyword]) < _MAX_EXACT_FLOAT):
+                return None
+        if items.get('divisibleBy') == 0 or not all(
+                isinstance(items.get(keyword), (str, type(None)))
+                for keyword in ('title', 'description')):
+            return None
+
+        if not allowed_types.issuperset(map(type, value)):
+            return None
+        array = numpy.array(value)
+        # nan, infinities and integers too large for floats are left to the validate_* methods
+        if array.dtype.kind not in 'if' or not (-_MAX_EXACT_FLOAT < array.min() and
+                                                array.max() < _MAX_EXACT_FLOAT):
+            return None
+
+        # the same comparisons as validate_minimum, validate_maximum and validate_divisibleBy
+        flagged = numpy.zeros(len(array), dtype=bool)
+        with numpy.errstate(all='ignore'):
+            if 'minimum' in items:
+                if items.get('exclusiveMinimum', False):
+                    flagged |= array <= items['minimum']
+                else:
+                    flagged |= array < items['minimum']
+            if 'maximum' in items:
+                if items.get('exclusiveMaximum', False):
+                    flagged |= array >= items['maximum']
+                else:
+                    flagged |= array > items['maximum']
+            if 'divisibleBy' in items:
+                flagged |= numpy.remainder(array, items['divisibleBy']) != 0
+        return numpy.flatnonzero(flagged).tolist()
+
     def validate_required(self, x, fieldname, schema, path, required):
         ''' Validates that the given field is present if required is True '''
         # Make sure the field is present
         if fieldname not in x and required:
-            self._error("Required field '{fieldname}' is missing", None, path, path=path,
-                        exctype=RequiredFieldValidationError)
+            self._error("Required field '{fieldname}' is missing", None, _render_path(path),
+                        path=path, exctype=RequiredFieldValidationError)
 
     def validate_blank(self, x, fieldname, schema, path, blank=False):
         ''' Validates that the given field is not blank if blank=False '''
@@ -343,12 +1352,24 @@ class SchemaValidator:
         if patternproperties is None:
             patternproperties = {}
 
-        value_obj = x.get(fieldname, {})
+        # like additionalProperties, only objects have properties to validate
+        value_obj = x.get(fieldname)
+        if not isinstance(value_obj, dict):
+            return
 
+        # only keys matching at least one of the patterns need to be tried one pattern at a time
+        if len(patternproperties) > 1:
+            matches = self._pattern_matcher(tuple(patternproperties))
+            candidates = [key for key in value_obj if matches(key)]
+        else:
+            candidates = value_obj
+
+        # like additionalProperties, values are validated in place in the object
         for pattern, schema in patternproperties.items():
-            for key, value in value_obj.items():
-                if re.match(pattern, key):
-                    self.__validate("_data", {"_data": value}, schema, path)
+            regex = self._compile_regex(pattern)
+            for key in candidates:
+                if regex.match(key):
+                    self.__validate(key, value_obj, schema, path)
 
     def validate_additionalItems(self, x, fieldname, schema, path, additionalItems=False):
         value = x.get(fieldname)
@@ -385,14 +1406,15 @@ class SchemaValidator:
         value = x.get(fieldname)
         if isinstance(additionalProperties, (dict, bool)):
             properties = schema.get("properties")
-            patterns = schema["patternProperties"].keys() if 'patternProperties' in schema else []
+            patterns = tuple(schema.get('patternProperties') or ())
+            matches = self._pattern_matcher(patterns) if patterns else None
             if properties is None:
                 properties = {}
             if value is None:
                 value = {}
             for eachProperty in value:
                 if (eachProperty not in properties and not
-                        any(re.match(p, eachProperty) for p in patterns)):
+                        (matches and matches(eachProperty))):
                     # If additionalProperties is the boolean value False
                     # then we don't accept any additional properties.
                     if additionalProperties is False:
@@ -508,13 +1530,40 @@ class SchemaValidator:
         format_validator = self._format_validators.get(format_option, None)
 
         if format_validator and value is not None:
+            cache = self._format_cache
+            if cache is not None and format_option in self._cacheable_formats:
+                # the type is part of the key so that 1, 1.0 and True aren't mixed up
+                key = (format_option, type(value), value)
+                try:
+                    if key in cache:
+                        return
+                except TypeError:
+                    # unhashable values are always checked
+                    cache = None
+            else:
+                cache = None
+
             try:
-                format_validator(self, fieldname, value, format_option)
-            except FieldValidationError as fve:
-                if self.fail_fast:
-                    raise
+                if self.stats is None:
+                    format_validator(self, fieldname, value, format_option)
                 else:
-                    self._errors.append(fve)
+                    start = perf_counter()
+                    try:
+                        format_validator(self, fieldname, value, format_option)
+                    finally:
+                        self.stats.record('format:' + format_option, _stats_path(path),
+                                          perf_counter() - start)
+            except FieldValidationError as fve:
+                # format validators don't know where the field is
+                if not fve.__dict__.get('_path'):
+                    fve._path = path
+                    fve.__dict__.pop('path', None)
+                    fve.__dict__.pop('path_parts', None)
+                self._add_error(fve)
+            else:
+                # only successes are cached, errors are reported with the name of the field
+                if cache is not None:
+                    cache.add(key)
 
         # TODO: warn about unsupported format ?
 
@@ -524,7 +1573,7 @@ class SchemaValidator:
         '''
         value = x.get(fieldname)
         if (isinstance(value, str) and
-            (isinstance(pattern, str) and not re.match(pattern, value)
+            (isinstance(pattern, str) and not self._compile_regex(pattern).match(value)
              or not isinstance(pattern, str) and not pattern.match(value))):
             self._error("does not match regular expression '{pattern}'", value, fieldname,
                         pattern=pattern, path=path)
@@ -545,19 +1594,27 @@ class SchemaValidator:
         if not isinstance(values, (list, tuple)):
             return
 
-        hashables = set()
+        seen = set()
+        # values without a canonical form can only be compared with each other
         unhashables = []
 
         for value in values:
-            if isinstance(value, (list, dict)):
-                container, add = unhashables, unhashables.append
+            if type(value) in _SCALAR_TYPES:
+                key = value
             else:
-                container, add = hashables, hashables.add
+                try:
+                    key = _canonical(value)
+                except TypeError:
+                    if value in unhashables:
+                        self._error("is not unique", value, fieldname, path=path)
+                    else:
+                        unhashables.append(value)
+                    continue
 
-            if value in container:
+            if key in seen:
                 self._error("is not unique", value, fieldname, path=path)
             else:
-                add(value)
+                seen.add(key)
 
     def validate_enum(self, x, fieldname, schema, path, options=None):
         '''
@@ -570,7 +1627,18 @@ class SchemaValidator:
             if not isinstance(options, Container):
                 raise SchemaError("Enumeration {!r} for field '{}' must be a container".format(
                                   options, fieldname))
-            if value not in options:
+            # enumerations of compiled schemas have a set of their hashable options
+            prepared = self._enums.get(id(options))
+            if prepared is not None and prepared[0] is options:
+                try:
+                    found = value in prepared[1]
+                except TypeError:
+                    found = value in options
+                else:
+                    found = found or (prepared[2] and value in prepared[2])
+            else:
+                found = value in options
+            if not found:
                 if not (value == '' and schema.get('blank', self.blank_by_default)):
                     self._error("is not in the enumeration: {options!r}", value, fieldname,
                                 options=options, path=path)
@@ -611,29 +1679,136 @@ class SchemaValidator:
         '''
         Validates a piece of json data against the provided json-schema.
         '''
-        self.__validate("data", {"data": data}, schema, '<obj>')
-        if self._errors:
-            raise MultipleValidationError(self._errors)
+        # errors are kept per call so that a validator can be reused and shared by threads
+        token = _call_errors.set([])
+        root_token = _call_root.set(schema)
+        try:
+            try:
+                self.__validate("data", {"data": data}, schema, '<obj>')
+            except _ErrorLimitReached:
+                pass
+            if self._errors:
+                raise MultipleValidationError(self._errors)
+        finally:
+            _call_root.reset(root_token)
+            _call_errors.reset(token)
+
+    def validate_many(self, documents, schema, workers=None, chunksize=256):
+        '''
+        Validates each piece of json data in an iterable against the provided json-schema.
+
+        Returns a list with an entry per document: the list of its validation errors,
+        which is empty if the document is valid.  Invalid documents don't stop the
+        batch, but a :class:`SchemaError` is still raised.
+
+        :param workers: optional number of processes to spread the documents over.
+            The validator and the schema are sent to each process once, so they (and
+            any custom format validators) must be picklable.  Changes made to the data
+            by ``apply_default_to_data`` or ``remove_unknown_properties`` are lost.
+        :param chunksize: number of documents sent to a process at a time when
+            ``workers`` is used
+        '''
+        if workers is None:
+            return [self._collect_errors(document, schema) for document in documents]
 
-    def __validate(self, fieldname, data, schema, path):
+        documents = iter(documents)
+        chunks = iter(lambda: list(itertools.islice(documents, chunksize)), [])
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(self, schema)) as executor:
+            return [errors for results in executor.map(_validate_chunk, chunks)
+                    for errors in results]
 
-        if schema is not None:
-            if not isinstance(schema, dict):
-                raise SchemaError("Type for field '%s' must be 'dict', got: '%s'" %
-                                  (fieldname, type(schema).__name__))
+    async def validate_async(self, data, schema, executor=None):
+        '''
+        Coroutine version of :meth:`validate`.
+
+        Validation runs in a thread of ``executor`` (the default executor of the event
+        loop if None), so the event loop keeps serving other tasks while a large
+        document is validated.
+        '''
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(executor, self.validate, data, schema)
+
+    async def validate_many_async(self, documents, schema, chunksize=256, executor=None):
+        '''
+        Asynchronous generator version of :meth:`validate_many` yielding the list of
+        errors of each document of an asynchronous iterable, in order.
+
+        Documents are validated by chunks of ``chunksize`` in a thread of ``executor``
+        (the default executor of the event loop if None).
+        '''
+        loop = asyncio.get_running_loop()
+        chunk = []
+        async for document in documents:
+            chunk.append(document)
+            if len(chunk) >= chunksize:
+                for errors in await loop.run_in_executor(executor, self.validate_many, chunk,
+                                                         schema):
+                    yield errors
+                chunk = []
+        if chunk:
+            for errors in await loop.run_in_executor(executor, self.validate_many, chunk, schema):
+                yield errors
+
+    def validate_columns(self, columns, schema):
+        '''
+        Validates a batch of records stored by columns against the provided json-schema of
+        each record, a flat object.
+
+        Returns a list with an entry per row: the list of the validation errors of the
+        record made of the values of each column in that row, which is empty if the record
+        is valid.
 
-            add_required_rule = self.required_by_default and 'required' not in schema
-            add_not_blank_rule = not self.blank_by_default and 'blank' not in schema
+        Each field is checked against the ``type``, ``enum``, ``pattern``, lengths and ranges
+        of its schema for a whole column at once, and only the rows this flags are validated
+        as records to report their errors.  Rows are all validated one by one for other
+        schemas, or when ``stats`` are recorded.
 
-            if add_required_rule or add_not_blank_rule:
-                newschema = copy.copy(schema)
+        :param columns: mapping of the name of each field to the sequence (list, tuple or
+            numpy array) of its values, or a pandas DataFrame or pyarrow Table.  Columns
+            must all have the same length.
+        '''
+        columns = _column_lists(columns)
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns must all have the same length, got: {sorted(lengths)}")
+        rows = lengths.pop() if lengths else 0
+
+        def record(index):
+            return {name: column[index] for name, column in columns.items()}
+
+        flagged = self._flag_rows(columns, rows, schema)
+        if flagged is None:
+            return [self._collect_errors(record(index), schema) for index in range(rows)]
+
+        results = [[] for index in range(rows)]
+        for index in sorted(flagged):
+            results[index] = self._collect_errors(record(index), schema)
+        return results
+
+    def _collect_errors(self, data, schema):
+        ''' Validates data like :meth:`validate` but returns the list of errors '''
+        try:
+            self.validate(data, schema)
+        except MultipleValidationError as mve:
+            return mve.errors
+        except ValidationError as e:
+            return [e]
+        return []
+
+    def __validate(self, fieldname, data, schema, path):
 
-                if add_required_rule:
-                    newschema['required'] = self.required_by_default
-                if add_not_blank_rule:
-                    newschema['blank'] = self.blank_by_default
+        if schema is not None:
+            # compiled schemas already know which validators to call
+            plan = self._plans.get(id(schema))
+            if plan is not None and plan[0] is schema:
+                steps, function = plan[1], plan[2]
             else:
-                newschema = schema
+                steps = function = None
+
+            if steps is None and not isinstance(schema, dict):
+                raise SchemaError("Type for field '%s' must be 'dict', got: '%s'" %
+                                  (fieldname, type(schema).__name__))
 
             # add default values first before checking for required fields
             if self.apply_default_to_data and 'default' in schema:
@@ -649,11 +1824,49 @@ class SchemaValidator:
                 if fieldname not in data:
                     data[fieldname] = self.get_default(schema['default'])
 
-            # iterate over schema and call all validators
-            for schemaprop in newschema:
-                validatorname = "validate_" + schemaprop
-                validator = getattr(self, validatorname, None)
+            if self.stats is not None:
+                if steps is None:
+                    steps = self._plan(schema, _call_root.get(None))
+                self._validate_steps_timed(data, fieldname, schema, path, steps)
+                return data
+            if function is not None:
+                function(data, fieldname, path)
+                return data
+            if steps is not None:
+                for keyword, validator, value in steps:
+                    validator(data, fieldname, schema, path, value)
+                return data
+
+            if '$ref' in schema:
+                self._validate_ref(data, fieldname, schema, path, schema['$ref'])
+                return data
+
+            # iterate over schema and call all validators, then apply the default required and
+            # blank rules in the order they would have if they were added to the schema
+            keywords = self.keywords
+            for schemaprop in schema:
+                validator = keywords.get(schemaprop)
                 if validator:
-                    validator(data, fieldname, schema, path, newschema.get(schemaprop))
+                    validator(data, fieldname, schema, path, schema[schemaprop])
+
+            if self.required_by_default and 'required' not in schema:
+                keywords['required'](data, fieldname, schema, path, self.required_by_default)
+            if not self.blank_by_default and 'blank' not in schema:
+                keywords['blank'](data, fieldname, schema, path, self.blank_by_default)
 
         return data
+
+
+# the validator and schema of a worker process of SchemaValidator.validate_many
+_worker = None
+
+
+def _init_worker(validator, schema):
+    global _worker
+    validator.compile(schema)
+    _worker = (validator, schema)
+
+
+def _validate_chunk(documents):
+    validator, schema = _worker
+    return validator.validate_many(documents, schema)